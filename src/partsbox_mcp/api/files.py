@@ -66,7 +66,7 @@ def _get_blob_storage() -> BlobStorage:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class FileUrlResponse:
     """Response for file URL retrieval."""
 
@@ -75,7 +75,7 @@ class FileUrlResponse:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageInfoResponse:
     """Response containing image metadata without the image data."""
 
@@ -87,7 +87,7 @@ class ImageInfoResponse:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageSizeEstimate:
     """Response containing estimated dimensions after resizing."""
 
@@ -104,7 +104,7 @@ class ImageSizeEstimate:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceResponse:
     """Response for resource-based file/image storage."""
 
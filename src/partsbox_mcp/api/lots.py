@@ -12,7 +12,7 @@ from typing import Any
 
 import requests
 
-from partsbox_mcp.client import api_client, apply_query, cache
+from partsbox_mcp.client import api_client, cache, fetch_list, normalize_query
 from partsbox_mcp.types import LotData
 
 
@@ -21,7 +21,7 @@ from partsbox_mcp.types import LotData
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class LotResponse:
     """Response for a single lot."""
 
@@ -30,7 +30,7 @@ class LotResponse:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PaginatedLotsResponse:
     """Response for paginated lots listing."""
 
@@ -45,7 +45,7 @@ class PaginatedLotsResponse:
     query_applied: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LotUpdateResponse:
     """Response for lot update operations."""
 
@@ -79,8 +79,8 @@ def list_lots(
             - CORRECT: "lot/name", "lot/id", "lot/part-id"
             - WRONG: `lot/name` (backticks create literal strings, not field references)
 
-            Using backticks will silently fail - queries will return empty results because
-            `lot/name` evaluates to the literal string "lot/name", not the field value.
+            Queries using backticks are rejected with an error, because
+            `lot/name` would evaluate to the literal string "lot/name", not the field value.
 
             Standard JMESPath examples:
             - "[?\"lot/expiration-date\" != null]" - lots with expiration
@@ -119,6 +119,8 @@ def list_lots(
             }
         }
     """
+    query = normalize_query(query)
+
     if limit < 1 or limit > 1000:
         return PaginatedLotsResponse(
             success=False,
@@ -144,19 +146,7 @@ def list_lots(
         )
 
     try:
-        if cache_key:
-            entry = cache.get(cache_key)
-            if entry:
-                data = entry.data
-                key = cache_key
-            else:
-                result = api_client._request("lot/all")
-                data = result.get("data", [])
-                key = cache.create(data)
-        else:
-            result = api_client._request("lot/all")
-            data = result.get("data", [])
-            key = cache.create(data)
+        data, key = fetch_list("lot/all", None, cache_key)
     except requests.RequestException as e:
         return PaginatedLotsResponse(
             success=False,
@@ -170,7 +160,7 @@ def list_lots(
         )
 
     if query:
-        result, error = apply_query(data, query)
+        result, error = cache.apply_query(key, data, query)
         if error:
             return PaginatedLotsResponse(
                 success=False,
@@ -16,7 +16,13 @@ from typing import Any
 
 import requests
 
-from partsbox_mcp.client import api_client, apply_query, cache
+from partsbox_mcp.client import (
+    api_client,
+    cache,
+    fetch_list,
+    normalize_query,
+    query_returns_list,
+)
 from partsbox_mcp.types import OrderData, OrderEntryData
 
 
@@ -25,7 +31,7 @@ from partsbox_mcp.types import OrderData, OrderEntryData
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderResponse:
     """Response for a single order."""
 
@@ -34,7 +40,7 @@ class OrderResponse:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PaginatedOrdersResponse:
     """Response for paginated orders listing."""
 
@@ -47,9 +53,11 @@ class PaginatedOrdersResponse:
     data: list[OrderData]
     error: str | None = None
     query_applied: str | None = None
+    etag: str | None = None
+    unchanged: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderOperationResponse:
     """Response for order modification operations."""
 
@@ -58,7 +66,7 @@ class OrderOperationResponse:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PaginatedOrderEntriesResponse:
     """Response for paginated order entries."""
 
@@ -71,6 +79,8 @@ class PaginatedOrderEntriesResponse:
     data: list[OrderEntryData]
     error: str | None = None
     query_applied: str | None = None
+    etag: str | None = None
+    unchanged: bool = False
 
 
 # =============================================================================
@@ -83,6 +93,7 @@ def list_orders(
     offset: int = 0,
     cache_key: str | None = None,
     query: str | None = None,
+    if_none_match: str | None = None,
 ) -> PaginatedOrdersResponse:
     """
     List all orders with optional JMESPath query and pagination.
@@ -98,8 +109,8 @@ def list_orders(
             - CORRECT: "order/vendor-name", "order/id", "order/created"
             - WRONG: `order/vendor-name` (backticks create literal strings, not field references)
 
-            Using backticks will silently fail - queries will return empty results because
-            `order/vendor-name` evaluates to the literal string "order/vendor-name", not the field value.
+            Queries using backticks are rejected with an error, because
+            `order/vendor-name` would evaluate to the literal string "order/vendor-name", not the field value.
 
             Standard JMESPath examples:
             - "[?\"order/arriving\" != null]" - orders with expected delivery
@@ -115,8 +126,17 @@ def list_orders(
             - "[?contains(nvl(\"order/vendor-name\", ''), 'Mouser')]" - safe vendor search
             - "[?contains(nvl(\"order/comments\", ''), 'urgent')]" - safe comments search
 
+        if_none_match: etag from a previous response. If the requested page is
+            unchanged, the response has unchanged=True and an empty data list.
+            Only meaningful on a fresh fetch without cache_key: a cache entry
+            is an immutable snapshot, so its pages always match their etag.
+
     Returns:
         PaginatedOrdersResponse with orders data and pagination info.
+        etag is a content hash of the page. It is set when the data was
+        freshly fetched or if_none_match was given, and is None for pages
+        served from cache_key. unchanged is True when the page matches
+        if_none_match; data is then empty.
 
         Data items schema:
         {
@@ -136,6 +156,8 @@ def list_orders(
             }
         }
     """
+    query = normalize_query(query)
+
     if limit < 1 or limit > 1000:
         return PaginatedOrdersResponse(
             success=False,
@@ -161,19 +183,7 @@ def list_orders(
         )
 
     try:
-        if cache_key:
-            entry = cache.get(cache_key)
-            if entry:
-                data = entry.data
-                key = cache_key
-            else:
-                result = api_client._request("order/all")
-                data = result.get("data", [])
-                key = cache.create(data)
-        else:
-            result = api_client._request("order/all")
-            data = result.get("data", [])
-            key = cache.create(data)
+        data, key = fetch_list("order/all", None, cache_key)
     except requests.RequestException as e:
         return PaginatedOrdersResponse(
             success=False,
@@ -186,8 +196,25 @@ def list_orders(
             data=[],
         )
 
+    page_id = (offset, limit, query)
+    served = cache.get_page(key, page_id) if if_none_match else None
+    if served is not None and served[0] == if_none_match:
+        _, total, served_offset, has_more = served
+        return PaginatedOrdersResponse(
+            success=True,
+            cache_key=key,
+            total=total,
+            offset=served_offset,
+            limit=limit,
+            has_more=has_more,
+            query_applied=query,
+            data=[],
+            etag=if_none_match,
+            unchanged=True,
+        )
+
     if query:
-        result, error = apply_query(data, query)
+        result, error = cache.apply_query(key, data, query)
         if error:
             return PaginatedOrdersResponse(
                 success=False,
@@ -203,7 +230,15 @@ def list_orders(
     else:
         result = data
 
-    if not isinstance(result, list):
+    # Hash the page only when the etag can be used: to answer if_none_match,
+    # or to hand out with freshly fetched data. A page of an existing cache
+    # entry never changes, so its etag would tell the caller nothing
+    want_etag = bool(if_none_match) or key != cache_key
+
+    if query and not query_returns_list(query) and not isinstance(result, list):
+        etag = (
+            cache.page_etag(key, page_id, result, 1, 0, False) if want_etag else None
+        )
         return PaginatedOrdersResponse(
             success=True,
             cache_key=key,
@@ -212,11 +247,19 @@ def list_orders(
             limit=limit,
             has_more=False,
             query_applied=query,
-            data=[result],
+            data=[] if etag and etag == if_none_match else [result],
+            etag=etag,
+            unchanged=bool(etag) and etag == if_none_match,
         )
 
     total = len(result)
     page = result[offset : offset + limit]
+    has_more = offset + limit < total
+    etag = (
+        cache.page_etag(key, page_id, page, total, offset, has_more)
+        if want_etag
+        else None
+    )
 
     return PaginatedOrdersResponse(
         success=True,
@@ -224,9 +267,11 @@ def list_orders(
         total=total,
         offset=offset,
         limit=limit,
-        has_more=offset + limit < total,
+        has_more=has_more,
         query_applied=query,
-        data=page,
+        data=[] if etag and etag == if_none_match else page,
+        etag=etag,
+        unchanged=bool(etag) and etag == if_none_match,
     )
 
 
@@ -334,6 +379,7 @@ def get_order_entries(
     offset: int = 0,
     cache_key: str | None = None,
     query: str | None = None,
+    if_none_match: str | None = None,
 ) -> PaginatedOrderEntriesResponse:
     """
     List stock items in an order.
@@ -350,8 +396,8 @@ def get_order_entries(
             - CORRECT: "stock/quantity", "stock/part-id", "stock/price"
             - WRONG: `stock/quantity` (backticks create literal strings, not field references)
 
-            Using backticks will silently fail - queries will return empty results because
-            `stock/quantity` evaluates to the literal string "stock/quantity", not the field value.
+            Queries using backticks are rejected with an error, because
+            `stock/quantity` would evaluate to the literal string "stock/quantity", not the field value.
 
             Standard JMESPath examples:
             - "[?\"stock/quantity\" > `100`]" - entries with quantity > 100
@@ -367,8 +413,17 @@ def get_order_entries(
             - "[?nvl(\"stock/currency\", '') == 'USD']" - safe currency check
             - "[?contains(nvl(\"stock/comments\", ''), 'priority')]" - safe comments search
 
+        if_none_match: etag from a previous response. If the requested page is
+            unchanged, the response has unchanged=True and an empty data list.
+            Only meaningful on a fresh fetch without cache_key: a cache entry
+            is an immutable snapshot, so its pages always match their etag.
+
     Returns:
         PaginatedOrderEntriesResponse with order entries and pagination info.
+        etag is a content hash of the page. It is set when the data was
+        freshly fetched or if_none_match was given, and is None for pages
+        served from cache_key. unchanged is True when the page matches
+        if_none_match; data is then empty.
 
         Data items schema:
         {
@@ -390,6 +445,8 @@ def get_order_entries(
             }
         }
     """
+    query = normalize_query(query)
+
     if not order_id:
         return PaginatedOrderEntriesResponse(
             success=False,
@@ -427,21 +484,9 @@ def get_order_entries(
         )
 
     try:
-        if cache_key:
-            entry = cache.get(cache_key)
-            if entry:
-                data = entry.data
-                key = cache_key
-            else:
-                result = api_client._request(
-                    "order/get-entries", {"order/id": order_id}
-                )
-                data = result.get("data", [])
-                key = cache.create(data)
-        else:
-            result = api_client._request("order/get-entries", {"order/id": order_id})
-            data = result.get("data", [])
-            key = cache.create(data)
+        data, key = fetch_list(
+            "order/get-entries", {"order/id": order_id}, cache_key
+        )
     except requests.RequestException as e:
         return PaginatedOrderEntriesResponse(
             success=False,
@@ -454,8 +499,25 @@ def get_order_entries(
             data=[],
         )
 
+    page_id = (offset, limit, query)
+    served = cache.get_page(key, page_id) if if_none_match else None
+    if served is not None and served[0] == if_none_match:
+        _, total, served_offset, has_more = served
+        return PaginatedOrderEntriesResponse(
+            success=True,
+            cache_key=key,
+            total=total,
+            offset=served_offset,
+            limit=limit,
+            has_more=has_more,
+            query_applied=query,
+            data=[],
+            etag=if_none_match,
+            unchanged=True,
+        )
+
     if query:
-        result, error = apply_query(data, query)
+        result, error = cache.apply_query(key, data, query)
         if error:
             return PaginatedOrderEntriesResponse(
                 success=False,
@@ -471,7 +533,15 @@ def get_order_entries(
     else:
         result = data
 
-    if not isinstance(result, list):
+    # Hash the page only when the etag can be used: to answer if_none_match,
+    # or to hand out with freshly fetched data. A page of an existing cache
+    # entry never changes, so its etag would tell the caller nothing
+    want_etag = bool(if_none_match) or key != cache_key
+
+    if query and not query_returns_list(query) and not isinstance(result, list):
+        etag = (
+            cache.page_etag(key, page_id, result, 1, 0, False) if want_etag else None
+        )
         return PaginatedOrderEntriesResponse(
             success=True,
             cache_key=key,
@@ -480,11 +550,19 @@ def get_order_entries(
             limit=limit,
             has_more=False,
             query_applied=query,
-            data=[result],
+            data=[] if etag and etag == if_none_match else [result],
+            etag=etag,
+            unchanged=bool(etag) and etag == if_none_match,
         )
 
     total = len(result)
     page = result[offset : offset + limit]
+    has_more = offset + limit < total
+    etag = (
+        cache.page_etag(key, page_id, page, total, offset, has_more)
+        if want_etag
+        else None
+    )
 
     return PaginatedOrderEntriesResponse(
         success=True,
@@ -492,9 +570,11 @@ def get_order_entries(
         total=total,
         offset=offset,
         limit=limit,
-        has_more=offset + limit < total,
+        has_more=has_more,
         query_applied=query,
-        data=page,
+        data=[] if etag and etag == if_none_match else page,
+        etag=etag,
+        unchanged=bool(etag) and etag == if_none_match,
     )
 
 
@@ -3,7 +3,7 @@ Parts API module.
 
 Provides MCP tools for part operations:
 - part/all - List all parts
-- part/get - Retrieve part details
+- part/get - Retrieve part details (singly or several concurrently)
 - part/create - Create new part
 - part/update - Modify part data
 - part/delete - Remove part
@@ -16,13 +16,20 @@ Provides MCP tools for part operations:
 - part/stock - Get total stock count for a part
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 import requests
 
-from partsbox_mcp.client import api_client, apply_query, cache
+from partsbox_mcp.client import (
+    api_client,
+    cache,
+    fetch_list,
+    normalize_query,
+    paging_error,
+)
 from partsbox_mcp.types import PartData, SourceData
+from partsbox_mcp.utils.batching import RequestBatcher
 
 
 # =============================================================================
@@ -30,7 +37,7 @@ from partsbox_mcp.types import PartData, SourceData
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class PaginatedPartsResponse:
     """Response for paginated parts listing."""
 
@@ -45,7 +52,7 @@ class PaginatedPartsResponse:
     query_applied: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PartResponse:
     """Response for a single part."""
 
@@ -54,7 +61,16 @@ class PartResponse:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
+class PartBatchResponse:
+    """Response for fetching several parts at once."""
+
+    success: bool
+    data: list[PartResponse] = field(default_factory=list)
+    error: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
 class PartOperationResponse:
     """Response for part modification operations."""
 
@@ -63,7 +79,7 @@ class PartOperationResponse:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PartStockResponse:
     """Response for part/stock total count."""
 
@@ -72,7 +88,16 @@ class PartStockResponse:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
+class PartStockBatchResponse:
+    """Response for fetching the stock totals of several parts at once."""
+
+    success: bool
+    data: dict[str, PartStockResponse] = field(default_factory=dict)
+    error: str | None = None
+
+
+@dataclass(slots=True)
 class PaginatedSourcesResponse:
     """Response for paginated sources listing (part/storage, part/lots)."""
 
@@ -87,6 +112,217 @@ class PaginatedSourcesResponse:
     query_applied: str | None = None
 
 
+# =============================================================================
+# Internal Helper Functions
+# =============================================================================
+
+_VALID_PART_TYPES = frozenset({"local", "linked", "sub-assembly", "meta"})
+_VALID_PART_TYPES_MSG = "part_type must be one of: " + ", ".join(sorted(_VALID_PART_TYPES))
+
+# Shared validation failures; the response types are frozen, so one
+# instance can be returned from every call
+_ERR_PART_ID_REQUIRED = PartOperationResponse(success=False, error="part_id is required")
+_ERR_NAME_REQUIRED = PartOperationResponse(success=False, error="name is required")
+_ERR_MEMBER_IDS_REQUIRED = PartOperationResponse(
+    success=False, error="member_ids is required"
+)
+_ERR_SUBSTITUTE_IDS_REQUIRED = PartOperationResponse(
+    success=False, error="substitute_ids is required"
+)
+_ERR_GET_PART_ID_REQUIRED = PartResponse(success=False, error="part_id is required")
+_ERR_STOCK_PART_ID_REQUIRED = PartStockResponse(
+    success=False, error="part_id is required"
+)
+
+
+def _err_paginated(
+    error: str, limit: int, cache_key: str = "", query: str | None = None
+) -> PaginatedPartsResponse:
+    """Build the empty failure response returned by list_parts."""
+    return PaginatedPartsResponse(
+        success=False,
+        error=error,
+        cache_key=cache_key,
+        total=0,
+        offset=0,
+        limit=limit,
+        has_more=False,
+        query_applied=query,
+        data=[],
+    )
+
+
+def _err_sources(
+    error: str, limit: int, cache_key: str = "", query: str | None = None
+) -> PaginatedSourcesResponse:
+    """Build the empty failure response returned by the part source listings."""
+    return PaginatedSourcesResponse(
+        success=False,
+        error=error,
+        cache_key=cache_key,
+        total=0,
+        offset=0,
+        limit=limit,
+        has_more=False,
+        query_applied=query,
+        data=[],
+    )
+
+
+def _paginate_sources(
+    endpoint: str,
+    part_id: str,
+    limit: int,
+    offset: int,
+    cache_key: str | None,
+    query: str | None,
+) -> PaginatedSourcesResponse:
+    """Shared body of get_part_storage and get_part_lots."""
+    query = normalize_query(query)
+
+    if not part_id:
+        return _err_sources("part_id is required", limit)
+
+    if not 1 <= limit <= 1000 or offset < 0:
+        return _err_sources(paging_error(limit), limit)
+
+    try:
+        data, key = fetch_list(endpoint, {"part/id": part_id}, cache_key)
+    except requests.RequestException as e:
+        return _err_sources(f"API request failed: {e}", limit)
+
+    if query:
+        result, error = cache.apply_query(key, data, query)
+        if error:
+            return _err_sources(error, limit, key, query)
+    else:
+        result = data
+
+    if not isinstance(result, list):
+        return PaginatedSourcesResponse(
+            success=True,
+            cache_key=key,
+            total=1,
+            offset=0,
+            limit=limit,
+            has_more=False,
+            query_applied=query,
+            data=[result],
+        )
+
+    total = len(result)
+    page = result[offset : offset + limit]
+
+    return PaginatedSourcesResponse(
+        success=True,
+        cache_key=key,
+        total=total,
+        offset=offset,
+        limit=limit,
+        has_more=offset + limit < total,
+        query_applied=query,
+        data=page,
+    )
+
+
+# Cache key of the most recently fetched parts catalog
+_last_parts_key: str | None = None
+
+
+def _fetch_parts(cache_key: str | None) -> tuple[list[dict[str, Any]], str]:
+    """
+    Return the parts catalog, from the cache or a fresh fetch.
+
+    get_all_parts() returns the same list object when the API reports the
+    catalog unchanged (304), so the entry created for it is reused along
+    with any sorted views and indexes already built on it.
+
+    Raises:
+        requests.RequestException: If the API request fails
+    """
+    global _last_parts_key
+    if cache_key:
+        entry = cache.get(cache_key)
+        if entry:
+            return entry.data, cache_key
+
+    data = api_client.get_all_parts()
+    entry = cache.get(_last_parts_key) if _last_parts_key else None
+    if entry is None or entry.data is not data:
+        _last_parts_key = cache.create(data)
+    return data, _last_parts_key
+
+
+def _set_part_fields(
+    payload: dict[str, Any],
+    *,
+    description: str | None,
+    notes: str | None,
+    footprint: str | None,
+    manufacturer: str | None,
+    mpn: str | None,
+    tags: list[str] | None,
+    cad_keys: list[str] | None,
+    custom_fields: dict[str, Any] | None,
+    low_stock_threshold: int | None,
+    attrition_percentage: float | None,
+    attrition_quantity: int | None,
+) -> None:
+    """Add the optional part fields that were provided to a create/update payload."""
+    fields = {
+        "part/description": description,
+        "part/notes": notes,
+        "part/footprint": footprint,
+        "part/manufacturer": manufacturer,
+        "part/mpn": mpn,
+        "part/tags": tags,
+        "part/cad-keys": cad_keys,
+        "part/custom": custom_fields,
+    }
+    for api_key, value in fields.items():
+        if value is not None:
+            payload[api_key] = value
+    if low_stock_threshold is not None:
+        payload["part/low-stock"] = {"report": low_stock_threshold}
+    if attrition_percentage is not None or attrition_quantity is not None:
+        attrition: dict[str, Any] = {}
+        if attrition_percentage is not None:
+            attrition["percentage"] = attrition_percentage
+        if attrition_quantity is not None:
+            attrition["quantity"] = attrition_quantity
+        payload["part/attrition"] = attrition
+
+
+def _part_operation(operation: str, payload: dict[str, Any]) -> PartOperationResponse:
+    """Send a part modification request and wrap its result."""
+    try:
+        result = api_client._request(operation, payload)
+        return PartOperationResponse(success=True, data=result.get("data"))
+    except requests.RequestException as e:
+        return PartOperationResponse(success=False, error=f"API request failed: {e}")
+
+
+# Coalesces concurrent id-list updates for the same part (see RequestBatcher)
+_id_batcher = RequestBatcher(dedupe=True)
+
+
+def _submit_ids(
+    operation: str, part_id: str, id_field: str, ids: list[str]
+) -> PartOperationResponse:
+    """Send an id-list update, merged with concurrent calls for the same part."""
+    try:
+        result = _id_batcher.submit(
+            (operation, part_id),
+            ids,
+            lambda batch: api_client._request(
+                operation, {"part/id": part_id, id_field: batch}
+            ),
+        )
+    except requests.RequestException as e:
+        return PartOperationResponse(success=False, error=f"API request failed: {e}")
+    return PartOperationResponse(success=True, data=result.get("data"))
+
+
 # =============================================================================
 # Tool Functions
 # =============================================================================
@@ -99,72 +335,38 @@ def list_parts(
     query: str | None = None,
 ) -> PaginatedPartsResponse:
     """List all parts with pagination and optional JMESPath query."""
-    # Validate parameters
-    if limit < 1 or limit > 1000:
-        return PaginatedPartsResponse(
-            success=False,
-            error="limit must be between 1 and 1000",
-            cache_key="",
-            total=0,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            data=[],
-        )
+    query = normalize_query(query)
 
-    if offset < 0:
-        return PaginatedPartsResponse(
-            success=False,
-            error="offset must be non-negative",
-            cache_key="",
-            total=0,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            data=[],
-        )
+    # Validate parameters
+    if not 1 <= limit <= 1000 or offset < 0:
+        return _err_paginated(paging_error(limit), limit)
 
     # Get or fetch data
     try:
-        if cache_key:
-            entry = cache.get(cache_key)
-            if entry:
-                data = entry.data
-                key = cache_key
-            else:
-                # Cache miss - fetch fresh
-                data = api_client.get_all_parts()
-                key = cache.create(data)
-        else:
-            data = api_client.get_all_parts()
-            key = cache.create(data)
+        data, key = _fetch_parts(cache_key)
     except requests.RequestException as e:
+        return _err_paginated(f"API request failed: {e}", limit)
+
+    # Later pages of an already-counted row filter stop at the page end
+    paged = cache.filter_page(key, data, query, offset, limit) if query else None
+    if paged is not None:
+        page, total = paged
         return PaginatedPartsResponse(
-            success=False,
-            error=f"API request failed: {e}",
-            cache_key="",
-            total=0,
-            offset=0,
+            success=True,
+            cache_key=key,
+            total=total,
+            offset=offset,
             limit=limit,
-            has_more=False,
-            data=[],
+            has_more=offset + limit < total,
+            query_applied=query,
+            data=page,
         )
 
     # Apply JMESPath query
     if query:
-        result, error = apply_query(data, query)
+        result, error = cache.apply_query(key, data, query)
         if error:
-            return PaginatedPartsResponse(
-                success=False,
-                error=error,
-                cache_key=key,
-                total=0,
-                offset=0,
-                limit=limit,
-                has_more=False,
-                query_applied=query,
-                data=[],
-            )
+            return _err_paginated(error, limit, cache_key=key, query=query)
     else:
         result = data
 
@@ -198,13 +400,17 @@ def list_parts(
     )
 
 
-def get_part(part_id: str) -> PartResponse:
-    """Get a specific part by ID."""
+def get_part(part_id: str, cache_key: str | None = None) -> PartResponse:
+    """Get a specific part by ID, from a list_parts cache entry if given."""
     if not part_id:
-        return PartResponse(
-            success=False,
-            error="part_id is required",
-        )
+        return _ERR_GET_PART_ID_REQUIRED
+
+    if cache_key:
+        entry = cache.get(cache_key)
+        if entry:
+            found = entry.equal_filter("part/id", part_id)
+            if found:
+                return PartResponse(success=True, data=found[0])
 
     try:
         data = api_client.get_part(part_id)
@@ -224,6 +430,29 @@ def get_part(part_id: str) -> PartResponse:
         )
 
 
+# Most part ids accepted by one get_parts call
+_MAX_BATCH_PART_IDS = 100
+
+
+def get_parts(part_ids: list[str], cache_key: str | None = None) -> PartBatchResponse:
+    """Get several parts by ID, fetching those not in the cache entry concurrently."""
+    if not part_ids:
+        return PartBatchResponse(success=False, error="part_ids is required")
+
+    unique_ids = list(dict.fromkeys(part_ids))
+    if len(unique_ids) > _MAX_BATCH_PART_IDS:
+        return PartBatchResponse(
+            success=False,
+            error=f"part_ids must contain at most {_MAX_BATCH_PART_IDS} ids",
+        )
+
+    results = api_client.map_concurrent(
+        lambda part_id: get_part(part_id, cache_key), unique_ids
+    )
+    by_id = dict(zip(unique_ids, results))
+    return PartBatchResponse(success=True, data=[by_id[pid] for pid in part_ids])
+
+
 def create_part(
     name: str,
     part_type: str = "local",
@@ -241,51 +470,32 @@ def create_part(
 ) -> PartOperationResponse:
     """Create a new part."""
     if not name:
-        return PartOperationResponse(success=False, error="name is required")
+        return _ERR_NAME_REQUIRED
 
-    valid_types = {"local", "linked", "sub-assembly", "meta"}
-    if part_type not in valid_types:
-        return PartOperationResponse(
-            success=False,
-            error=f"part_type must be one of: {', '.join(valid_types)}",
-        )
+    if part_type not in _VALID_PART_TYPES:
+        return PartOperationResponse(success=False, error=_VALID_PART_TYPES_MSG)
 
     payload: dict[str, Any] = {
         "part/name": name,
         "part/type": part_type,
     }
 
-    if description is not None:
-        payload["part/description"] = description
-    if notes is not None:
-        payload["part/notes"] = notes
-    if footprint is not None:
-        payload["part/footprint"] = footprint
-    if manufacturer is not None:
-        payload["part/manufacturer"] = manufacturer
-    if mpn is not None:
-        payload["part/mpn"] = mpn
-    if tags is not None:
-        payload["part/tags"] = tags
-    if cad_keys is not None:
-        payload["part/cad-keys"] = cad_keys
-    if low_stock_threshold is not None:
-        payload["part/low-stock"] = {"report": low_stock_threshold}
-    if attrition_percentage is not None or attrition_quantity is not None:
-        attrition: dict[str, Any] = {}
-        if attrition_percentage is not None:
-            attrition["percentage"] = attrition_percentage
-        if attrition_quantity is not None:
-            attrition["quantity"] = attrition_quantity
-        payload["part/attrition"] = attrition
-    if custom_fields is not None:
-        payload["part/custom"] = custom_fields
+    _set_part_fields(
+        payload,
+        description=description,
+        notes=notes,
+        footprint=footprint,
+        manufacturer=manufacturer,
+        mpn=mpn,
+        tags=tags,
+        cad_keys=cad_keys,
+        custom_fields=custom_fields,
+        low_stock_threshold=low_stock_threshold,
+        attrition_percentage=attrition_percentage,
+        attrition_quantity=attrition_quantity,
+    )
 
-    try:
-        result = api_client._request("part/create", payload)
-        return PartOperationResponse(success=True, data=result.get("data"))
-    except requests.RequestException as e:
-        return PartOperationResponse(success=False, error=f"API request failed: {e}")
+    return _part_operation("part/create", payload)
 
 
 def update_part(
@@ -305,55 +515,36 @@ def update_part(
 ) -> PartOperationResponse:
     """Update an existing part."""
     if not part_id:
-        return PartOperationResponse(success=False, error="part_id is required")
+        return _ERR_PART_ID_REQUIRED
 
     payload: dict[str, Any] = {"part/id": part_id}
 
     if name is not None:
         payload["part/name"] = name
-    if description is not None:
-        payload["part/description"] = description
-    if notes is not None:
-        payload["part/notes"] = notes
-    if footprint is not None:
-        payload["part/footprint"] = footprint
-    if manufacturer is not None:
-        payload["part/manufacturer"] = manufacturer
-    if mpn is not None:
-        payload["part/mpn"] = mpn
-    if tags is not None:
-        payload["part/tags"] = tags
-    if cad_keys is not None:
-        payload["part/cad-keys"] = cad_keys
-    if low_stock_threshold is not None:
-        payload["part/low-stock"] = {"report": low_stock_threshold}
-    if attrition_percentage is not None or attrition_quantity is not None:
-        attrition: dict[str, Any] = {}
-        if attrition_percentage is not None:
-            attrition["percentage"] = attrition_percentage
-        if attrition_quantity is not None:
-            attrition["quantity"] = attrition_quantity
-        payload["part/attrition"] = attrition
-    if custom_fields is not None:
-        payload["part/custom"] = custom_fields
+    _set_part_fields(
+        payload,
+        description=description,
+        notes=notes,
+        footprint=footprint,
+        manufacturer=manufacturer,
+        mpn=mpn,
+        tags=tags,
+        cad_keys=cad_keys,
+        custom_fields=custom_fields,
+        low_stock_threshold=low_stock_threshold,
+        attrition_percentage=attrition_percentage,
+        attrition_quantity=attrition_quantity,
+    )
 
-    try:
-        result = api_client._request("part/update", payload)
-        return PartOperationResponse(success=True, data=result.get("data"))
-    except requests.RequestException as e:
-        return PartOperationResponse(success=False, error=f"API request failed: {e}")
+    return _part_operation("part/update", payload)
 
 
 def delete_part(part_id: str) -> PartOperationResponse:
     """Delete a part."""
     if not part_id:
-        return PartOperationResponse(success=False, error="part_id is required")
+        return _ERR_PART_ID_REQUIRED
 
-    try:
-        result = api_client._request("part/delete", {"part/id": part_id})
-        return PartOperationResponse(success=True, data=result.get("data"))
-    except requests.RequestException as e:
-        return PartOperationResponse(success=False, error=f"API request failed: {e}")
+    return _part_operation("part/delete", {"part/id": part_id})
 
 
 def add_meta_part_ids(
@@ -362,20 +553,13 @@ def add_meta_part_ids(
 ) -> PartOperationResponse:
     """Add members to a meta-part."""
     if not part_id:
-        return PartOperationResponse(success=False, error="part_id is required")
+        return _ERR_PART_ID_REQUIRED
     if not member_ids:
-        return PartOperationResponse(success=False, error="member_ids is required")
+        return _ERR_MEMBER_IDS_REQUIRED
 
-    payload: dict[str, Any] = {
-        "part/id": part_id,
-        "part/meta-part-ids": member_ids,
-    }
-
-    try:
-        result = api_client._request("part/add-meta-part-ids", payload)
-        return PartOperationResponse(success=True, data=result.get("data"))
-    except requests.RequestException as e:
-        return PartOperationResponse(success=False, error=f"API request failed: {e}")
+    return _submit_ids(
+        "part/add-meta-part-ids", part_id, "part/meta-part-ids", member_ids
+    )
 
 
 def remove_meta_part_ids(
@@ -384,20 +568,13 @@ def remove_meta_part_ids(
 ) -> PartOperationResponse:
     """Remove members from a meta-part."""
     if not part_id:
-        return PartOperationResponse(success=False, error="part_id is required")
+        return _ERR_PART_ID_REQUIRED
     if not member_ids:
-        return PartOperationResponse(success=False, error="member_ids is required")
+        return _ERR_MEMBER_IDS_REQUIRED
 
-    payload: dict[str, Any] = {
-        "part/id": part_id,
-        "part/meta-part-ids": member_ids,
-    }
-
-    try:
-        result = api_client._request("part/remove-meta-part-ids", payload)
-        return PartOperationResponse(success=True, data=result.get("data"))
-    except requests.RequestException as e:
-        return PartOperationResponse(success=False, error=f"API request failed: {e}")
+    return _submit_ids(
+        "part/remove-meta-part-ids", part_id, "part/meta-part-ids", member_ids
+    )
 
 
 def add_substitute_ids(
@@ -406,20 +583,13 @@ def add_substitute_ids(
 ) -> PartOperationResponse:
     """Add substitutes to a part."""
     if not part_id:
-        return PartOperationResponse(success=False, error="part_id is required")
+        return _ERR_PART_ID_REQUIRED
     if not substitute_ids:
-        return PartOperationResponse(success=False, error="substitute_ids is required")
-
-    payload: dict[str, Any] = {
-        "part/id": part_id,
-        "part/substitute-ids": substitute_ids,
-    }
+        return _ERR_SUBSTITUTE_IDS_REQUIRED
 
-    try:
-        result = api_client._request("part/add-substitute-ids", payload)
-        return PartOperationResponse(success=True, data=result.get("data"))
-    except requests.RequestException as e:
-        return PartOperationResponse(success=False, error=f"API request failed: {e}")
+    return _submit_ids(
+        "part/add-substitute-ids", part_id, "part/substitute-ids", substitute_ids
+    )
 
 
 def remove_substitute_ids(
@@ -428,20 +598,13 @@ def remove_substitute_ids(
 ) -> PartOperationResponse:
     """Remove substitutes from a part."""
     if not part_id:
-        return PartOperationResponse(success=False, error="part_id is required")
+        return _ERR_PART_ID_REQUIRED
     if not substitute_ids:
-        return PartOperationResponse(success=False, error="substitute_ids is required")
-
-    payload: dict[str, Any] = {
-        "part/id": part_id,
-        "part/substitute-ids": substitute_ids,
-    }
+        return _ERR_SUBSTITUTE_IDS_REQUIRED
 
-    try:
-        result = api_client._request("part/remove-substitute-ids", payload)
-        return PartOperationResponse(success=True, data=result.get("data"))
-    except requests.RequestException as e:
-        return PartOperationResponse(success=False, error=f"API request failed: {e}")
+    return _submit_ids(
+        "part/remove-substitute-ids", part_id, "part/substitute-ids", substitute_ids
+    )
 
 
 def get_part_storage(
@@ -452,110 +615,7 @@ def get_part_storage(
     query: str | None = None,
 ) -> PaginatedSourcesResponse:
     """List stock sources for a part, aggregating lots by storage location."""
-    if not part_id:
-        return PaginatedSourcesResponse(
-            success=False,
-            error="part_id is required",
-            cache_key="",
-            total=0,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            data=[],
-        )
-
-    if limit < 1 or limit > 1000:
-        return PaginatedSourcesResponse(
-            success=False,
-            error="limit must be between 1 and 1000",
-            cache_key="",
-            total=0,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            data=[],
-        )
-
-    if offset < 0:
-        return PaginatedSourcesResponse(
-            success=False,
-            error="offset must be non-negative",
-            cache_key="",
-            total=0,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            data=[],
-        )
-
-    try:
-        if cache_key:
-            entry = cache.get(cache_key)
-            if entry:
-                data = entry.data
-                key = cache_key
-            else:
-                result = api_client._request("part/storage", {"part/id": part_id})
-                data = result.get("data", [])
-                key = cache.create(data)
-        else:
-            result = api_client._request("part/storage", {"part/id": part_id})
-            data = result.get("data", [])
-            key = cache.create(data)
-    except requests.RequestException as e:
-        return PaginatedSourcesResponse(
-            success=False,
-            error=f"API request failed: {e}",
-            cache_key="",
-            total=0,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            data=[],
-        )
-
-    if query:
-        result, error = apply_query(data, query)
-        if error:
-            return PaginatedSourcesResponse(
-                success=False,
-                error=error,
-                cache_key=key,
-                total=0,
-                offset=0,
-                limit=limit,
-                has_more=False,
-                query_applied=query,
-                data=[],
-            )
-    else:
-        result = data
-
-    if not isinstance(result, list):
-        return PaginatedSourcesResponse(
-            success=True,
-            cache_key=key,
-            total=1,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            query_applied=query,
-            data=[result],
-        )
-
-    total = len(result)
-    page = result[offset : offset + limit]
-
-    return PaginatedSourcesResponse(
-        success=True,
-        cache_key=key,
-        total=total,
-        offset=offset,
-        limit=limit,
-        has_more=offset + limit < total,
-        query_applied=query,
-        data=page,
-    )
+    return _paginate_sources("part/storage", part_id, limit, offset, cache_key, query)
 
 
 def get_part_lots(
@@ -566,116 +626,41 @@ def get_part_lots(
     query: str | None = None,
 ) -> PaginatedSourcesResponse:
     """List stock sources for a part without aggregating lots."""
-    if not part_id:
-        return PaginatedSourcesResponse(
-            success=False,
-            error="part_id is required",
-            cache_key="",
-            total=0,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            data=[],
-        )
-
-    if limit < 1 or limit > 1000:
-        return PaginatedSourcesResponse(
-            success=False,
-            error="limit must be between 1 and 1000",
-            cache_key="",
-            total=0,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            data=[],
-        )
-
-    if offset < 0:
-        return PaginatedSourcesResponse(
-            success=False,
-            error="offset must be non-negative",
-            cache_key="",
-            total=0,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            data=[],
-        )
-
-    try:
-        if cache_key:
-            entry = cache.get(cache_key)
-            if entry:
-                data = entry.data
-                key = cache_key
-            else:
-                result = api_client._request("part/lots", {"part/id": part_id})
-                data = result.get("data", [])
-                key = cache.create(data)
-        else:
-            result = api_client._request("part/lots", {"part/id": part_id})
-            data = result.get("data", [])
-            key = cache.create(data)
-    except requests.RequestException as e:
-        return PaginatedSourcesResponse(
-            success=False,
-            error=f"API request failed: {e}",
-            cache_key="",
-            total=0,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            data=[],
-        )
-
-    if query:
-        result, error = apply_query(data, query)
-        if error:
-            return PaginatedSourcesResponse(
-                success=False,
-                error=error,
-                cache_key=key,
-                total=0,
-                offset=0,
-                limit=limit,
-                has_more=False,
-                query_applied=query,
-                data=[],
-            )
-    else:
-        result = data
-
-    if not isinstance(result, list):
-        return PaginatedSourcesResponse(
-            success=True,
-            cache_key=key,
-            total=1,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            query_applied=query,
-            data=[result],
-        )
-
-    total = len(result)
-    page = result[offset : offset + limit]
-
-    return PaginatedSourcesResponse(
-        success=True,
-        cache_key=key,
-        total=total,
-        offset=offset,
-        limit=limit,
-        has_more=offset + limit < total,
-        query_applied=query,
-        data=page,
-    )
-
-
-def get_part_stock(part_id: str) -> PartStockResponse:
+    return _paginate_sources("part/lots", part_id, limit, offset, cache_key, query)
+
+
+def _cached_stock_total(part_id: str, cache_key: str) -> int | None:
+    """
+    Sum a part's stock from a cached get_part_storage/get_part_lots listing.
+
+    Returns None, so the caller asks the API, unless the entry is a non-empty
+    source listing for this part with only on-hand sources: ordered or
+    reserved sources are not part of the stock total.
+    """
+    entry = cache.get(cache_key)
+    if entry is None or not entry.data:
+        return None
+    total = 0
+    for source in entry.data:
+        if (
+            not isinstance(source, dict)
+            or source.get("source/part-id") != part_id
+            or source.get("source/status") is not None
+        ):
+            return None
+        total += source.get("source/quantity") or 0
+    return total
+
+
+def get_part_stock(part_id: str, cache_key: str | None = None) -> PartStockResponse:
     """Get the total stock count for a part."""
     if not part_id:
-        return PartStockResponse(success=False, error="part_id is required")
+        return _ERR_STOCK_PART_ID_REQUIRED
+
+    if cache_key:
+        total = _cached_stock_total(part_id, cache_key)
+        if total is not None:
+            return PartStockResponse(success=True, total=total)
 
     try:
         result = api_client._request("part/stock", {"part/id": part_id})
@@ -686,3 +671,19 @@ def get_part_stock(part_id: str) -> PartStockResponse:
         return PartStockResponse(success=True, total=total)
     except requests.RequestException as e:
         return PartStockResponse(success=False, error=f"API request failed: {e}")
+
+
+def get_parts_stock(part_ids: list[str]) -> PartStockBatchResponse:
+    """Get the total stock counts for several parts, fetched concurrently."""
+    if not part_ids:
+        return PartStockBatchResponse(success=False, error="part_ids is required")
+
+    unique_ids = list(dict.fromkeys(part_ids))
+    if len(unique_ids) > _MAX_BATCH_PART_IDS:
+        return PartStockBatchResponse(
+            success=False,
+            error=f"part_ids must contain at most {_MAX_BATCH_PART_IDS} ids",
+        )
+
+    results = api_client.map_concurrent(get_part_stock, unique_ids)
+    return PartStockBatchResponse(success=True, data=dict(zip(unique_ids, results)))
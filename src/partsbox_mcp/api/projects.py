@@ -19,12 +19,19 @@ Provides MCP tools for project/BOM management:
 """
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, TypeVar
 
 import requests
 
-from partsbox_mcp.client import api_client, apply_query, cache
+from partsbox_mcp.client import (
+    api_client,
+    cache,
+    fetch_list,
+    normalize_query,
+    paging_error,
+)
 from partsbox_mcp.types import BuildData, ProjectData, ProjectEntryData
+from partsbox_mcp.utils.batching import RequestBatcher
 
 
 # =============================================================================
@@ -32,7 +39,7 @@ from partsbox_mcp.types import BuildData, ProjectData, ProjectEntryData
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectResponse:
     """Response for a single project."""
 
@@ -41,7 +48,7 @@ class ProjectResponse:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PaginatedProjectsResponse:
     """Response for paginated projects listing."""
 
@@ -56,7 +63,7 @@ class PaginatedProjectsResponse:
     query_applied: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProjectOperationResponse:
     """Response for project modification operations."""
 
@@ -65,7 +72,7 @@ class ProjectOperationResponse:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PaginatedEntriesResponse:
     """Response for paginated BOM entries."""
 
@@ -80,7 +87,7 @@ class PaginatedEntriesResponse:
     query_applied: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PaginatedBuildsResponse:
     """Response for paginated builds listing."""
 
@@ -95,7 +102,7 @@ class PaginatedBuildsResponse:
     query_applied: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BuildResponse:
     """Response for a single build."""
 
@@ -104,6 +111,119 @@ class BuildResponse:
     error: str | None = None
 
 
+# =============================================================================
+# Internal Helper Functions
+# =============================================================================
+
+
+# Cache key of the most recently fetched project list
+_last_projects_key: str | None = None
+
+
+def _fetch_projects(cache_key: str | None) -> tuple[list[dict[str, Any]], str]:
+    """
+    Return the project list, from the cache or a fresh fetch.
+
+    get_all_projects() returns the same list object when the API reports
+    the list unchanged (304), so the entry created for it is reused along
+    with its views and memoized queries.
+
+    Raises:
+        requests.RequestException: If the API request fails
+    """
+    global _last_projects_key
+    if cache_key:
+        entry = cache.get(cache_key)
+        if entry:
+            return entry.data, cache_key
+
+    data = api_client.get_all_projects()
+    entry = cache.get(_last_projects_key) if _last_projects_key else None
+    if entry is None or entry.data is not data:
+        _last_projects_key = cache.create(data)
+    return data, _last_projects_key
+
+
+def _active_projects(data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return the projects that are not archived."""
+    return [proj for proj in data if not proj.get("project/archived", False)]
+
+
+_PaginatedT = TypeVar(
+    "_PaginatedT",
+    PaginatedProjectsResponse,
+    PaginatedEntriesResponse,
+    PaginatedBuildsResponse,
+)
+
+
+def _err_paginated(
+    response_type: type[_PaginatedT],
+    error: str,
+    limit: int,
+    cache_key: str = "",
+    query: str | None = None,
+) -> _PaginatedT:
+    """Build the empty failure response returned by the project listings."""
+    return response_type(
+        success=False,
+        error=error,
+        cache_key=cache_key,
+        total=0,
+        offset=0,
+        limit=limit,
+        has_more=False,
+        query_applied=query,
+        data=[],
+    )
+
+
+def _paginated(
+    response_type: type[_PaginatedT],
+    result: list[Any],
+    cache_key: str,
+    offset: int,
+    limit: int,
+    query: str | None,
+) -> _PaginatedT:
+    """Build the response for one page of a project listing's result list."""
+    total = len(result)
+    return response_type(
+        success=True,
+        cache_key=cache_key,
+        total=total,
+        offset=offset,
+        limit=limit,
+        has_more=offset + limit < total,
+        query_applied=query,
+        data=result[offset : offset + limit],
+    )
+
+
+# Coalesces concurrent BOM entry mutations for the same project (see
+# RequestBatcher); BOM edits tend to arrive as many small calls
+_entry_batcher = RequestBatcher()
+
+
+def _submit_entries(
+    operation: str, project_id: str, items_field: str, items: list[Any]
+) -> ProjectOperationResponse:
+    """Send a BOM entry mutation, merged with concurrent calls for the project."""
+    try:
+        result = _entry_batcher.submit(
+            (operation, project_id),
+            items,
+            lambda batch: api_client._request(
+                operation, {"project/id": project_id, items_field: batch}
+            ),
+        )
+    except requests.RequestException as e:
+        return ProjectOperationResponse(
+            success=False, error=f"API request failed: {e}"
+        )
+    return ProjectOperationResponse(success=True, data=result.get("data"))
+
+
 # =============================================================================
 # Tool Functions
 # =============================================================================
@@ -130,8 +250,8 @@ def list_projects(
             - CORRECT: "project/name", "project/id", "project/archived"
             - WRONG: `project/name` (backticks create literal strings, not field references)
 
-            Using backticks will silently fail - queries will return empty results because
-            `project/name` evaluates to the literal string "project/name", not the field value.
+            Queries using backticks are rejected with an error, because
+            `project/name` would evaluate to the literal string "project/name", not the field value.
 
             Standard JMESPath examples:
             - "[?\"project/archived\" == `false`]" - active projects only
@@ -170,102 +290,44 @@ def list_projects(
             }
         }
     """
-    if limit < 1 or limit > 1000:
-        return PaginatedProjectsResponse(
-            success=False,
-            error="limit must be between 1 and 1000",
-            cache_key="",
-            total=0,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            data=[],
-        )
+    query = normalize_query(query)
 
-    if offset < 0:
-        return PaginatedProjectsResponse(
-            success=False,
-            error="offset must be non-negative",
-            cache_key="",
-            total=0,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            data=[],
-        )
+    if not 1 <= limit <= 1000 or offset < 0:
+        return _err_paginated(PaginatedProjectsResponse, paging_error(limit), limit)
 
     try:
-        if cache_key:
-            entry = cache.get(cache_key)
-            if entry:
-                data = entry.data
-                key = cache_key
-            else:
-                result = api_client._request("project/all")
-                data = result.get("data", [])
-                key = cache.create(data)
-        else:
-            result = api_client._request("project/all")
-            data = result.get("data", [])
-            key = cache.create(data)
+        data, key = _fetch_projects(cache_key)
     except requests.RequestException as e:
-        return PaginatedProjectsResponse(
-            success=False,
-            error=f"API request failed: {e}",
-            cache_key="",
-            total=0,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            data=[],
+        return _err_paginated(
+            PaginatedProjectsResponse, f"API request failed: {e}", limit
         )
 
-    # Filter out archived if not requested
+    # Filter out archived if not requested; the filtered list is kept on the
+    # cache entry so later pages (and their queries) reuse it
     if not include_archived:
-        data = [proj for proj in data if not proj.get("project/archived", False)]
+        active = cache.view(key, "active", _active_projects)
+        data = active if active is not None else _active_projects(data)
 
     if query:
-        result, error = apply_query(data, query)
+        result, error = cache.apply_query(key, data, query)
         if error:
+            return _err_paginated(PaginatedProjectsResponse, error, limit, key, query)
+        # Only a query can turn the dataset into a non-list result
+        if not isinstance(result, list):
             return PaginatedProjectsResponse(
-                success=False,
-                error=error,
+                success=True,
                 cache_key=key,
-                total=0,
+                total=1,
                 offset=0,
                 limit=limit,
                 has_more=False,
                 query_applied=query,
-                data=[],
+                data=[result],
             )
     else:
         result = data
 
-    if not isinstance(result, list):
-        return PaginatedProjectsResponse(
-            success=True,
-            cache_key=key,
-            total=1,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            query_applied=query,
-            data=[result],
-        )
-
-    total = len(result)
-    page = result[offset : offset + limit]
-
-    return PaginatedProjectsResponse(
-        success=True,
-        cache_key=key,
-        total=total,
-        offset=offset,
-        limit=limit,
-        has_more=offset + limit < total,
-        query_applied=query,
-        data=page,
-    )
+    return _paginated(PaginatedProjectsResponse, result, key, offset, limit, query)
 
 
 def get_project(project_id: str) -> ProjectResponse:
@@ -520,8 +582,8 @@ def get_project_entries(
             - CORRECT: "entry/quantity", "entry/part-id", "entry/order"
             - WRONG: `entry/quantity` (backticks create literal strings, not field references)
 
-            Using backticks will silently fail - queries will return empty results because
-            `entry/quantity` evaluates to the literal string "entry/quantity", not the field value.
+            Queries using backticks are rejected with an error, because
+            `entry/quantity` would evaluate to the literal string "entry/quantity", not the field value.
 
             Standard JMESPath examples:
             - "[?\"entry/quantity\" > `10`]" - entries with quantity > 10
@@ -559,116 +621,44 @@ def get_project_entries(
             }
         }
     """
+    query = normalize_query(query)
+
     if not project_id:
-        return PaginatedEntriesResponse(
-            success=False,
-            error="project_id is required",
-            cache_key="",
-            total=0,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            data=[],
-        )
+        return _err_paginated(PaginatedEntriesResponse, "project_id is required", limit)
 
-    if limit < 1 or limit > 1000:
-        return PaginatedEntriesResponse(
-            success=False,
-            error="limit must be between 1 and 1000",
-            cache_key="",
-            total=0,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            data=[],
-        )
+    if not 1 <= limit <= 1000 or offset < 0:
+        return _err_paginated(PaginatedEntriesResponse, paging_error(limit), limit)
 
-    if offset < 0:
-        return PaginatedEntriesResponse(
-            success=False,
-            error="offset must be non-negative",
-            cache_key="",
-            total=0,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            data=[],
-        )
+    payload: dict[str, Any] = {"project/id": project_id}
+    if build_id:
+        payload["build/id"] = build_id
 
     try:
-        if cache_key:
-            entry = cache.get(cache_key)
-            if entry:
-                data = entry.data
-                key = cache_key
-            else:
-                payload: dict[str, Any] = {"project/id": project_id}
-                if build_id:
-                    payload["build/id"] = build_id
-                result = api_client._request("project/get-entries", payload)
-                data = result.get("data", [])
-                key = cache.create(data)
-        else:
-            payload = {"project/id": project_id}
-            if build_id:
-                payload["build/id"] = build_id
-            result = api_client._request("project/get-entries", payload)
-            data = result.get("data", [])
-            key = cache.create(data)
+        data, key = fetch_list("project/get-entries", payload, cache_key)
     except requests.RequestException as e:
-        return PaginatedEntriesResponse(
-            success=False,
-            error=f"API request failed: {e}",
-            cache_key="",
-            total=0,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            data=[],
+        return _err_paginated(
+            PaginatedEntriesResponse, f"API request failed: {e}", limit
         )
 
     if query:
-        result, error = apply_query(data, query)
+        result, error = cache.apply_query(key, data, query)
         if error:
+            return _err_paginated(PaginatedEntriesResponse, error, limit, key, query)
+        if not isinstance(result, list):
             return PaginatedEntriesResponse(
-                success=False,
-                error=error,
+                success=True,
                 cache_key=key,
-                total=0,
+                total=1,
                 offset=0,
                 limit=limit,
                 has_more=False,
                 query_applied=query,
-                data=[],
+                data=[result],
             )
     else:
         result = data
 
-    if not isinstance(result, list):
-        return PaginatedEntriesResponse(
-            success=True,
-            cache_key=key,
-            total=1,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            query_applied=query,
-            data=[result],
-        )
-
-    total = len(result)
-    page = result[offset : offset + limit]
-
-    return PaginatedEntriesResponse(
-        success=True,
-        cache_key=key,
-        total=total,
-        offset=offset,
-        limit=limit,
-        has_more=offset + limit < total,
-        query_applied=query,
-        data=page,
-    )
+    return _paginated(PaginatedEntriesResponse, result, key, offset, limit, query)
 
 
 def add_project_entries(
@@ -695,18 +685,9 @@ def add_project_entries(
     if not entries:
         return ProjectOperationResponse(success=False, error="entries is required")
 
-    payload: dict[str, Any] = {
-        "project/id": project_id,
-        "project/entries": entries,
-    }
-
-    try:
-        result = api_client._request("project/add-entries", payload)
-        return ProjectOperationResponse(success=True, data=result.get("data"))
-    except requests.RequestException as e:
-        return ProjectOperationResponse(
-            success=False, error=f"API request failed: {e}"
-        )
+    return _submit_entries(
+        "project/add-entries", project_id, "project/entries", entries
+    )
 
 
 def update_project_entries(
@@ -730,18 +711,9 @@ def update_project_entries(
     if not entries:
         return ProjectOperationResponse(success=False, error="entries is required")
 
-    payload: dict[str, Any] = {
-        "project/id": project_id,
-        "project/entries": entries,
-    }
-
-    try:
-        result = api_client._request("project/update-entries", payload)
-        return ProjectOperationResponse(success=True, data=result.get("data"))
-    except requests.RequestException as e:
-        return ProjectOperationResponse(
-            success=False, error=f"API request failed: {e}"
-        )
+    return _submit_entries(
+        "project/update-entries", project_id, "project/entries", entries
+    )
 
 
 def delete_project_entries(
@@ -765,18 +737,9 @@ def delete_project_entries(
     if not entry_ids:
         return ProjectOperationResponse(success=False, error="entry_ids is required")
 
-    payload: dict[str, Any] = {
-        "project/id": project_id,
-        "entry/ids": entry_ids,
-    }
-
-    try:
-        result = api_client._request("project/delete-entries", payload)
-        return ProjectOperationResponse(success=True, data=result.get("data"))
-    except requests.RequestException as e:
-        return ProjectOperationResponse(
-            success=False, error=f"API request failed: {e}"
-        )
+    return _submit_entries(
+        "project/delete-entries", project_id, "entry/ids", entry_ids
+    )
 
 
 def get_project_builds(
@@ -801,8 +764,8 @@ def get_project_builds(
             - CORRECT: "build/id", "build/project-id", "build/comments"
             - WRONG: `build/id` (backticks create literal strings, not field references)
 
-            Using backticks will silently fail - queries will return empty results because
-            `build/id` evaluates to the literal string "build/id", not the field value.
+            Queries using backticks are rejected with an error, because
+            `build/id` would evaluate to the literal string "build/id", not the field value.
 
             Standard JMESPath examples:
             - "sort_by(@, &\"build/id\")" - sort by build ID
@@ -829,114 +792,42 @@ def get_project_builds(
             }
         }
     """
-    if not project_id:
-        return PaginatedBuildsResponse(
-            success=False,
-            error="project_id is required",
-            cache_key="",
-            total=0,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            data=[],
-        )
+    query = normalize_query(query)
 
-    if limit < 1 or limit > 1000:
-        return PaginatedBuildsResponse(
-            success=False,
-            error="limit must be between 1 and 1000",
-            cache_key="",
-            total=0,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            data=[],
-        )
+    if not project_id:
+        return _err_paginated(PaginatedBuildsResponse, "project_id is required", limit)
 
-    if offset < 0:
-        return PaginatedBuildsResponse(
-            success=False,
-            error="offset must be non-negative",
-            cache_key="",
-            total=0,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            data=[],
-        )
+    if not 1 <= limit <= 1000 or offset < 0:
+        return _err_paginated(PaginatedBuildsResponse, paging_error(limit), limit)
 
     try:
-        if cache_key:
-            entry = cache.get(cache_key)
-            if entry:
-                data = entry.data
-                key = cache_key
-            else:
-                result = api_client._request(
-                    "project/get-builds", {"project/id": project_id}
-                )
-                data = result.get("data", [])
-                key = cache.create(data)
-        else:
-            result = api_client._request(
-                "project/get-builds", {"project/id": project_id}
-            )
-            data = result.get("data", [])
-            key = cache.create(data)
+        data, key = fetch_list(
+            "project/get-builds", {"project/id": project_id}, cache_key
+        )
     except requests.RequestException as e:
-        return PaginatedBuildsResponse(
-            success=False,
-            error=f"API request failed: {e}",
-            cache_key="",
-            total=0,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            data=[],
+        return _err_paginated(
+            PaginatedBuildsResponse, f"API request failed: {e}", limit
         )
 
     if query:
-        result, error = apply_query(data, query)
+        result, error = cache.apply_query(key, data, query)
         if error:
+            return _err_paginated(PaginatedBuildsResponse, error, limit, key, query)
+        if not isinstance(result, list):
             return PaginatedBuildsResponse(
-                success=False,
-                error=error,
+                success=True,
                 cache_key=key,
-                total=0,
+                total=1,
                 offset=0,
                 limit=limit,
                 has_more=False,
                 query_applied=query,
-                data=[],
+                data=[result],
             )
     else:
         result = data
 
-    if not isinstance(result, list):
-        return PaginatedBuildsResponse(
-            success=True,
-            cache_key=key,
-            total=1,
-            offset=0,
-            limit=limit,
-            has_more=False,
-            query_applied=query,
-            data=[result],
-        )
-
-    total = len(result)
-    page = result[offset : offset + limit]
-
-    return PaginatedBuildsResponse(
-        success=True,
-        cache_key=key,
-        total=total,
-        offset=offset,
-        limit=limit,
-        has_more=offset + limit < total,
-        query_applied=query,
-        data=page,
-    )
+    return _paginated(PaginatedBuildsResponse, result, key, offset, limit, query)
 
 
 def get_build(build_id: str) -> BuildResponse:
@@ -22,7 +22,7 @@ from partsbox_mcp.types import StockEntryData
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class StockOperationResponse:
     """Response for stock modification operations."""
 
@@ -31,7 +31,7 @@ class StockOperationResponse:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PaginatedStockResponse:
     """Response for paginated stock listing."""
 
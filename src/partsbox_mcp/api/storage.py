@@ -18,7 +18,7 @@ from typing import Any
 
 import requests
 
-from partsbox_mcp.client import api_client, apply_query, cache
+from partsbox_mcp.client import api_client, cache, fetch_list, normalize_query
 from partsbox_mcp.types import SourceData, StorageData
 
 
@@ -27,7 +27,7 @@ from partsbox_mcp.types import SourceData, StorageData
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageResponse:
     """Response for a single storage location."""
 
@@ -36,7 +36,7 @@ class StorageResponse:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PaginatedStorageResponse:
     """Response for paginated storage listing."""
 
@@ -51,7 +51,7 @@ class PaginatedStorageResponse:
     query_applied: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageOperationResponse:
     """Response for storage modification operations."""
 
@@ -60,7 +60,7 @@ class StorageOperationResponse:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PaginatedStoragePartsResponse:
     """Response for paginated parts in storage."""
 
@@ -75,7 +75,7 @@ class PaginatedStoragePartsResponse:
     query_applied: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PaginatedStorageLotsResponse:
     """Response for paginated lots in storage."""
 
@@ -116,8 +116,8 @@ def list_storage_locations(
             - CORRECT: "storage/name", "storage/id", "storage/archived"
             - WRONG: `storage/name` (backticks create literal strings, not field references)
 
-            Using backticks will silently fail - queries will return empty results because
-            `storage/name` evaluates to the literal string "storage/name", not the field value.
+            Queries using backticks are rejected with an error, because
+            `storage/name` would evaluate to the literal string "storage/name", not the field value.
 
             Standard JMESPath examples:
             - "[?\"storage/archived\" == `false`]" - active only
@@ -159,6 +159,8 @@ def list_storage_locations(
             }
         }
     """
+    query = normalize_query(query)
+
     if limit < 1 or limit > 1000:
         return PaginatedStorageResponse(
             success=False,
@@ -184,19 +186,7 @@ def list_storage_locations(
         )
 
     try:
-        if cache_key:
-            entry = cache.get(cache_key)
-            if entry:
-                data = entry.data
-                key = cache_key
-            else:
-                result = api_client._request("storage/all")
-                data = result.get("data", [])
-                key = cache.create(data)
-        else:
-            result = api_client._request("storage/all")
-            data = result.get("data", [])
-            key = cache.create(data)
+        data, key = fetch_list("storage/all", None, cache_key)
     except requests.RequestException as e:
         return PaginatedStorageResponse(
             success=False,
@@ -214,7 +204,7 @@ def list_storage_locations(
         data = [loc for loc in data if not loc.get("storage/archived", False)]
 
     if query:
-        result, error = apply_query(data, query)
+        result, error = cache.apply_query(key, data, query)
         if error:
             return PaginatedStorageResponse(
                 success=False,
@@ -477,8 +467,8 @@ def list_storage_parts(
             - CORRECT: "source/quantity", "source/part-id", "source/status"
             - WRONG: `source/quantity` (backticks create literal strings, not field references)
 
-            Using backticks will silently fail - queries will return empty results because
-            `source/quantity` evaluates to the literal string "source/quantity", not the field value.
+            Queries using backticks are rejected with an error, because
+            `source/quantity` would evaluate to the literal string "source/quantity", not the field value.
 
             Standard JMESPath examples:
             - "[?\"source/quantity\" > `100`]" - parts with quantity > 100
@@ -511,6 +501,8 @@ def list_storage_parts(
             }
         }
     """
+    query = normalize_query(query)
+
     if not storage_id:
         return PaginatedStoragePartsResponse(
             success=False,
@@ -548,21 +540,9 @@ def list_storage_parts(
         )
 
     try:
-        if cache_key:
-            entry = cache.get(cache_key)
-            if entry:
-                data = entry.data
-                key = cache_key
-            else:
-                result = api_client._request(
-                    "storage/parts", {"storage/id": storage_id}
-                )
-                data = result.get("data", [])
-                key = cache.create(data)
-        else:
-            result = api_client._request("storage/parts", {"storage/id": storage_id})
-            data = result.get("data", [])
-            key = cache.create(data)
+        data, key = fetch_list(
+            "storage/parts", {"storage/id": storage_id}, cache_key
+        )
     except requests.RequestException as e:
         return PaginatedStoragePartsResponse(
             success=False,
@@ -576,7 +556,7 @@ def list_storage_parts(
         )
 
     if query:
-        result, error = apply_query(data, query)
+        result, error = cache.apply_query(key, data, query)
         if error:
             return PaginatedStoragePartsResponse(
                 success=False,
@@ -641,8 +621,8 @@ def list_storage_lots(
             - CORRECT: "source/quantity", "source/lot-id", "source/status"
             - WRONG: `source/quantity` (backticks create literal strings, not field references)
 
-            Using backticks will silently fail - queries will return empty results because
-            `source/quantity` evaluates to the literal string "source/quantity", not the field value.
+            Queries using backticks are rejected with an error, because
+            `source/quantity` would evaluate to the literal string "source/quantity", not the field value.
 
             Standard JMESPath examples:
             - "[?\"source/quantity\" > `0`]" - lots with positive quantity
@@ -675,6 +655,8 @@ def list_storage_lots(
             }
         }
     """
+    query = normalize_query(query)
+
     if not storage_id:
         return PaginatedStorageLotsResponse(
             success=False,
@@ -712,21 +694,9 @@ def list_storage_lots(
         )
 
     try:
-        if cache_key:
-            entry = cache.get(cache_key)
-            if entry:
-                data = entry.data
-                key = cache_key
-            else:
-                result = api_client._request(
-                    "storage/lots", {"storage/id": storage_id}
-                )
-                data = result.get("data", [])
-                key = cache.create(data)
-        else:
-            result = api_client._request("storage/lots", {"storage/id": storage_id})
-            data = result.get("data", [])
-            key = cache.create(data)
+        data, key = fetch_list(
+            "storage/lots", {"storage/id": storage_id}, cache_key
+        )
     except requests.RequestException as e:
         return PaginatedStorageLotsResponse(
             success=False,
@@ -740,7 +710,7 @@ def list_storage_lots(
         )
 
     if query:
-        result, error = apply_query(data, query)
+        result, error = cache.apply_query(key, data, query)
         if error:
             return PaginatedStorageLotsResponse(
                 success=False,
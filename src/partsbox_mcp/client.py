@@ -5,20 +5,42 @@ This module provides:
 - PartsBoxClient: HTTP client for the PartsBox API
 - PaginationCache: Client-controlled caching for pagination
 - JMESPath query support with custom functions (nvl, int, str, regex_replace)
+- fetch_list / paging_error / normalize_query: Shared steps of the paginated
+  listing tools
 """
 
+import atexit
+import bisect
+import hashlib
+import json
+import multiprocessing
 import os
+import re
+import sys
+import threading
 import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from time import time
-from typing import Any
+from typing import Any, Callable, Iterable, TypeVar
 
 import jmespath
 import requests
 from dotenv import load_dotenv
 
-from partsbox_mcp.utils.jmespath_extensions import search_with_custom_functions
+from partsbox_mcp.utils.jmespath_extensions import (
+    FilterFallback,
+    compile_expression,
+    compile_row_filter,
+    compile_row_predicate,
+    row_matches,
+    search_chunk,
+    search_with_custom_functions,
+)
 
 # Load environment variables from multiple locations
 # 1. Try the current working directory first
@@ -57,7 +79,7 @@ if not API_KEY:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheInfo:
     """Information about a cache entry."""
 
@@ -75,11 +97,204 @@ class CacheEntry:
     created_at: float = field(default_factory=time)
     last_accessed: float = field(default_factory=time)
     ttl: int = 300  # 5 minutes default
+    # Memoized `sort_by(@, &"<field>")` results, keyed by field name
+    sorted_by: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    # Per-field (sorted numeric values, row indices) for range filters
+    numeric_index: dict[str, tuple[list[float], list[int]]] = field(
+        default_factory=dict
+    )
+    # Per-field (rows where value is not null, rows where it is null)
+    null_split: dict[
+        str, tuple[list[dict[str, Any]], list[dict[str, Any]]]
+    ] = field(default_factory=dict)
+    # Per-field string value -> row indices, for equality filters
+    equality_index: dict[str, dict[str, list[int]]] = field(default_factory=dict)
+    # Per-field (array element -> row indices, has null rows, has non-array rows)
+    membership_index: dict[str, tuple[dict[str, list[int]], bool, bool]] = field(
+        default_factory=dict
+    )
+    # Per-field (sorted string values, row indices, has null rows, has
+    # non-string rows), for prefix filters
+    prefix_index: dict[str, tuple[list[str], list[int], bool, bool]] = field(
+        default_factory=dict
+    )
+    # Match counts of row filters already evaluated in full, keyed by query
+    match_counts: dict[str, int] = field(default_factory=dict)
+    # Per-field (all non-null values are strings or arrays, has null rows)
+    text_fields: dict[str, tuple[bool, bool]] = field(default_factory=dict)
+    # Each row serialized to JSON text, for substring prefiltering
+    raw_rows: list[str] | None = None
+    # Derived subsets of data (e.g. active projects only), keyed by name
+    views: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    # Most recently used query results, keyed by stripped expression, or by
+    # (view name, stripped expression) for queries over a view
+    query_results: OrderedDict[str | tuple[str, str], Any] = field(
+        default_factory=OrderedDict
+    )
+    # Served pages, keyed by (offset, limit, query): (content hash, total,
+    # offset, has_more) as returned with the page
+    etags: dict[tuple[int, int, str | None], tuple[str, int, int, bool]] = field(
+        default_factory=dict
+    )
 
     def touch(self) -> None:
         """Update last accessed time."""
         self.last_accessed = time()
 
+    def range_filter(
+        self, field_name: str, op: str, value: float
+    ) -> list[dict[str, Any]]:
+        """
+        Return rows whose numeric field satisfies `<field> <op> <value>`.
+
+        Matches JMESPath ordering semantics: rows where the field is missing,
+        null, boolean or non-numeric never match. Rows keep their original
+        order.
+        """
+        index = self.numeric_index.get(field_name)
+        if index is None:
+            pairs = sorted(
+                (row[field_name], i)
+                for i, row in enumerate(self.data)
+                if isinstance(row.get(field_name), (int, float))
+                and not isinstance(row.get(field_name), bool)
+            )
+            index = self.numeric_index[field_name] = (
+                [v for v, _ in pairs],
+                [i for _, i in pairs],
+            )
+
+        values, rows = index
+        if op == ">":
+            lo, hi = bisect.bisect_right(values, value), len(values)
+        elif op == ">=":
+            lo, hi = bisect.bisect_left(values, value), len(values)
+        elif op == "<":
+            lo, hi = 0, bisect.bisect_left(values, value)
+        else:
+            lo, hi = 0, bisect.bisect_right(values, value)
+        return [self.data[i] for i in sorted(rows[lo:hi])]
+
+    def equal_filter(self, field_name: str, value: str) -> list[dict[str, Any]]:
+        """Return rows whose field equals a string value, in original order."""
+        index = self.equality_index.get(field_name)
+        if index is None:
+            index = {}
+            for i, row in enumerate(self.data):
+                row_value = row.get(field_name)
+                if isinstance(row_value, str):
+                    index.setdefault(row_value, []).append(i)
+            self.equality_index[field_name] = index
+        return [self.data[i] for i in index.get(value, ())]
+
+    def contains_filter(
+        self, field_name: str, value: str, null_as_empty: bool
+    ) -> list[dict[str, Any]] | None:
+        """
+        Return rows whose array field contains a string, in original order.
+
+        Returns None when the index cannot reproduce JMESPath semantics:
+        string fields (substring match) or null fields not wrapped in
+        nvl(..., `[]`) (a type error). Callers then run the full query.
+        """
+        entry = self.membership_index.get(field_name)
+        if entry is None:
+            index: dict[str, list[int]] = {}
+            has_null = has_other = False
+            for i, row in enumerate(self.data):
+                items = row.get(field_name)
+                if items is None:
+                    has_null = True
+                    continue
+                if not isinstance(items, list):
+                    has_other = True
+                    continue
+                for item in items:
+                    if isinstance(item, str):
+                        rows = index.setdefault(item, [])
+                        if not rows or rows[-1] != i:
+                            rows.append(i)
+            entry = self.membership_index[field_name] = (index, has_null, has_other)
+
+        index, has_null, has_other = entry
+        if has_other or (has_null and not null_as_empty):
+            return None
+        return [self.data[i] for i in index.get(value, ())]
+
+    def prefix_filter(
+        self, field_name: str, prefix: str, null_as_empty: bool
+    ) -> list[dict[str, Any]] | None:
+        """
+        Return rows whose string field starts with a prefix, in original order.
+
+        Returns None when the index cannot reproduce JMESPath semantics:
+        non-string values, or null values not wrapped in nvl(..., '') (both
+        type errors), and the empty prefix, which also matches nulls mapped
+        to ''. Callers then run the full query.
+        """
+        entry = self.prefix_index.get(field_name)
+        if entry is None:
+            pairs = []
+            has_null = has_other = False
+            for i, row in enumerate(self.data):
+                value = row.get(field_name)
+                if isinstance(value, str):
+                    pairs.append((value, i))
+                elif value is None:
+                    has_null = True
+                else:
+                    has_other = True
+            pairs.sort()
+            entry = self.prefix_index[field_name] = (
+                [v for v, _ in pairs],
+                [i for _, i in pairs],
+                has_null,
+                has_other,
+            )
+
+        values, rows, has_null, has_other = entry
+        if not prefix or has_other or (has_null and not null_as_empty):
+            return None
+        matched = []
+        for pos in range(bisect.bisect_left(values, prefix), len(values)):
+            if not values[pos].startswith(prefix):
+                break
+            matched.append(rows[pos])
+        return [self.data[i] for i in sorted(matched)]
+
+    def is_text_field(self, field_name: str, allow_null: bool) -> bool:
+        """Check that contains() on a field cannot raise a type error for any row."""
+        kinds = self.text_fields.get(field_name)
+        if kinds is None:
+            all_text, has_null = True, False
+            for row in self.data:
+                value = row.get(field_name)
+                if value is None:
+                    has_null = True
+                elif not isinstance(value, (str, list)):
+                    all_text = False
+                    break
+            kinds = self.text_fields[field_name] = (all_text, has_null)
+        all_text, has_null = kinds
+        return all_text and (allow_null or not has_null)
+
+    def row_text(self) -> list[str]:
+        """Return each row serialized to JSON text, computing it on first use."""
+        if self.raw_rows is None:
+            self.raw_rows = [
+                json.dumps(row, ensure_ascii=False, default=str) for row in self.data
+            ]
+        return self.raw_rows
+
+    def null_filter(self, field_name: str, is_null: bool) -> list[dict[str, Any]]:
+        """Return rows where the field is (or is not) null or missing."""
+        split = self.null_split.get(field_name)
+        if split is None:
+            present = [row for row in self.data if row.get(field_name) is not None]
+            absent = [row for row in self.data if row.get(field_name) is None]
+            split = self.null_split[field_name] = (present, absent)
+        return split[1] if is_null else split[0]
+
     @property
     def is_expired(self) -> bool:
         """Check if entry has exceeded TTL since last access."""
@@ -101,6 +316,10 @@ class CacheEntry:
 # =============================================================================
 
 
+# Number of query results memoized on each cache entry
+QUERY_RESULTS_PER_ENTRY = 16
+
+
 class PaginationCache:
     """Manages cached datasets with client-controlled keys."""
 
@@ -119,13 +338,14 @@ class PaginationCache:
         """Retrieve cache entry, return None if missing/expired."""
         self._lazy_cleanup()
         entry = self._cache.get(key)
-        if entry and not entry.is_expired:
-            entry.touch()
-            return entry
-        # Clean up expired entry
-        if key in self._cache:
-            del self._cache[key]
-        return None
+        if entry is None:
+            return None
+        if entry.is_expired:
+            # Clean up expired entry
+            self._cache.pop(key, None)
+            return None
+        entry.touch()
+        return entry
 
     def get_info(self, key: str) -> CacheInfo:
         """Get information about a cache entry."""
@@ -139,6 +359,249 @@ class PaginationCache:
             expires_in_seconds=entry.expires_in_seconds,
         )
 
+    def apply_query(
+        self, key: str, data: list[dict[str, Any]], expression: str
+    ) -> tuple[Any, str | None]:
+        """
+        Apply a JMESPath expression to cached data, reusing derived views.
+
+        A few common query shapes are answered from per-entry indexes instead
+        of a full JMESPath scan:
+        - `sort_by(@, &"<field>")` is sorted once and the result memoized
+        - `[?"<field>" > `<n>`]` (and >=, <, <=) uses a sorted numeric index
+        - `[?"<field>" != null]` / `== null` uses a memoized null split
+        - `[?"<field>" == '<value>']` uses a per-field equality index
+        - `[?contains("<field>", '<value>')]`, optionally with the field
+          wrapped in nvl(..., `[]`), uses a per-field array membership index
+        - `[?starts_with("<field>", '<prefix>')]`, optionally with the field
+          wrapped in nvl(..., ''), uses a per-field sorted string index
+
+        All other expressions fall through to apply_query(). The last
+        QUERY_RESULTS_PER_ENTRY results are kept on the entry, so paging
+        through a query evaluates it once. The match count of plain row
+        filters is also recorded, so filter_page() can serve later pages
+        once the result itself has been evicted.
+
+        `data` may also be one of the entry's views (see view()); results
+        over a view are memoized too, but always evaluated with JMESPath.
+        """
+        expression = expression.strip()
+        if not expression:
+            return data, None
+        entry = self._cache.get(key)
+        if entry is None:
+            return apply_query(data, expression)
+
+        memo_key: str | tuple[str, str] = expression
+        if entry.data is not data:
+            view = next(
+                (name for name, rows in entry.views.items() if rows is data), None
+            )
+            if view is None:
+                return apply_query(data, expression)
+            memo_key = (view, expression)
+
+        if memo_key in entry.query_results:
+            entry.query_results.move_to_end(memo_key)
+            return entry.query_results[memo_key], None
+
+        if memo_key is expression:
+            result, error = self._query_entry(entry, data, expression)
+        else:
+            result, error = apply_query(data, expression)
+        if error is not None:
+            return result, error
+
+        entry.query_results[memo_key] = result
+        if len(entry.query_results) > QUERY_RESULTS_PER_ENTRY:
+            entry.query_results.popitem(last=False)
+        if (
+            memo_key is expression
+            and isinstance(result, list)
+            and compile_row_predicate(expression) is not None
+        ):
+            entry.match_counts[expression] = len(result)
+        return result, None
+
+    def view(
+        self,
+        key: str,
+        name: str,
+        build: Callable[[list[dict[str, Any]]], list[dict[str, Any]]],
+    ) -> list[dict[str, Any]] | None:
+        """
+        Return a derived subset of an entry's data, building it on first use.
+
+        Returns None if the entry is missing.
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        rows = entry.views.get(name)
+        if rows is None:
+            rows = entry.views[name] = build(entry.data)
+        return rows
+
+    def filter_page(
+        self,
+        key: str,
+        data: list[dict[str, Any]],
+        expression: str,
+        offset: int,
+        limit: int,
+    ) -> tuple[list[dict[str, Any]], int] | None:
+        """
+        Return one page of a row filter, scanning no further than the page end.
+
+        A list result still memoized on the entry is sliced directly.
+        Otherwise, since responses always report the total match count, the
+        scan only applies once apply_query() has evaluated the same filter
+        on this entry in full. Index-backed filters are left to apply_query(),
+        which answers them without a scan.
+
+        Returns:
+            Tuple of (page, total), or None if the page must be computed by
+            apply_query() instead
+        """
+        entry = self._cache.get(key)
+        if entry is None or entry.data is not data:
+            return None
+
+        expression = expression.strip()
+        result = entry.query_results.get(expression)
+        if isinstance(result, list):
+            entry.query_results.move_to_end(expression)
+            return result[offset : offset + limit], len(result)
+
+        total = entry.match_counts.get(expression)
+        predicate = compile_row_predicate(expression)
+        if total is None or predicate is None or _is_indexed_filter(expression):
+            return None
+
+        page: list[dict[str, Any]] = []
+        matched = 0
+        end = offset + limit
+        try:
+            for row in data:
+                if matched >= end:
+                    break
+                if row_matches(predicate, row):
+                    if matched >= offset:
+                        page.append(row)
+                    matched += 1
+        except jmespath.exceptions.JMESPathError:
+            return None
+        return page, total
+
+    def _query_entry(
+        self, entry: CacheEntry, data: list[dict[str, Any]], expression: str
+    ) -> tuple[Any, str | None]:
+        """Dispatch a stripped expression to an entry index or JMESPath."""
+        match = _NUMERIC_RANGE.match(expression)
+        if match:
+            field_name, op, value = match.groups()
+            return entry.range_filter(field_name, op, int(value)), None
+
+        match = _NULL_CHECK.match(expression)
+        if match:
+            field_name, op = match.groups()
+            return entry.null_filter(field_name, op == "=="), None
+
+        match = _FIELD_EQUALS.match(expression)
+        if match:
+            field_name, value = match.groups()
+            return entry.equal_filter(field_name, value), None
+
+        match = _FIELD_CONTAINS.match(expression)
+        if match:
+            nvl_field, field_name, value = match.groups()
+            rows = entry.contains_filter(
+                nvl_field or field_name, value, null_as_empty=nvl_field is not None
+            )
+            if rows is not None:
+                return rows, None
+            return self._prefiltered_query(entry, data, expression)
+
+        match = _FIELD_STARTS_WITH.match(expression)
+        if match:
+            nvl_field, field_name, prefix = match.groups()
+            rows = entry.prefix_filter(
+                nvl_field or field_name, prefix, null_as_empty=nvl_field is not None
+            )
+            if rows is not None:
+                return rows, None
+            return apply_query(data, expression)
+
+        match = _SORT_BY_FIELD.match(expression)
+        if match is None:
+            return self._prefiltered_query(entry, data, expression)
+
+        field_name = match.group(1)
+        view = entry.sorted_by.get(field_name)
+        if view is None:
+            result, error = apply_query(data, expression)
+            if error or not isinstance(result, list):
+                return result, error
+            view = entry.sorted_by[field_name] = result
+        return view, None
+
+    def _prefiltered_query(
+        self, entry: CacheEntry, data: list[dict[str, Any]], expression: str
+    ) -> tuple[Any, str | None]:
+        """
+        Run a row filter only over rows whose JSON text holds its contains() literals.
+
+        A substring scan of the serialized rows is much cheaper than walking
+        every row in JMESPath. Rows without the literal cannot satisfy the
+        contains() condition, so dropping them first gives the same result;
+        see _contains_prefilter() for when this holds.
+        """
+        terms = _contains_prefilter(expression)
+        if not terms or not all(
+            entry.is_text_field(field_name, allow_null=nvl)
+            for field_name, _, nvl in terms
+        ):
+            return apply_query(data, expression)
+
+        literals = [literal for _, literal, _ in terms]
+        rows = [
+            row
+            for row, text in zip(data, entry.row_text())
+            if all(literal in text for literal in literals)
+        ]
+        return apply_query(rows, expression)
+
+    def get_page(
+        self, key: str, page: tuple[int, int, str | None]
+    ) -> tuple[str, int, int, bool] | None:
+        """Return (etag, total, offset, has_more) for a previously served page."""
+        entry = self._cache.get(key)
+        return entry.etags.get(page) if entry else None
+
+    def page_etag(
+        self,
+        key: str,
+        page: tuple[int, int, str | None],
+        data: Any,
+        total: int,
+        offset: int,
+        has_more: bool,
+    ) -> str:
+        """
+        Return the etag for a page, computing it on first use.
+
+        The page's pagination fields are stored with the etag, so an
+        unchanged response can report them without re-running the query.
+        """
+        served = self.get_page(key, page)
+        if served is not None:
+            return served[0]
+        etag = compute_etag(data)
+        entry = self._cache.get(key)
+        if entry:
+            entry.etags[page] = (etag, total, offset, has_more)
+        return etag
+
     def invalidate(self, key: str) -> bool:
         """Explicitly invalidate a cache entry."""
         if key in self._cache:
@@ -153,11 +616,124 @@ class PaginationCache:
             del self._cache[k]
 
 
+def compute_etag(data: Any) -> str:
+    """Return a stable content hash for a page of response data."""
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+
 # =============================================================================
 # PartsBox API Client
 # =============================================================================
 
 
+# Strings up to this length are interned by _intern_strings(). Values that
+# repeat across parts (types, manufacturers, tags, storage ids, currencies)
+# are short; longer text such as notes and descriptions is mostly unique.
+_INTERN_MAX_LENGTH = 64
+
+
+def _intern_strings(value: Any) -> Any:
+    """
+    Intern short string values in a decoded JSON document.
+
+    json.loads() already shares repeated object keys within one document, but
+    every repeated string value (e.g. "Yageo" on each of thousands of parts)
+    is a separate object. Interning collapses them to one copy, which shrinks
+    cached catalogs and turns index lookups on those fields into identity
+    comparisons. Dicts and lists are updated in place.
+    """
+    if isinstance(value, dict):
+        for key, item in list(value.items()):
+            if isinstance(item, str):
+                if len(item) <= _INTERN_MAX_LENGTH:
+                    value[key] = sys.intern(item)
+            elif isinstance(item, (dict, list)):
+                _intern_strings(item)
+        return value
+    if isinstance(value, list):
+        for i, item in enumerate(value):
+            if isinstance(item, str):
+                if len(item) <= _INTERN_MAX_LENGTH:
+                    value[i] = sys.intern(item)
+            elif isinstance(item, (dict, list)):
+                _intern_strings(item)
+    return value
+
+
+# Upper bound on requests in flight at once from map_concurrent(); the
+# session's connection pool is sized to match so no request waits for a socket
+MAX_CONCURRENT_REQUESTS = 8
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# Operations that change data returned by part/all
+_PART_WRITE_OPERATIONS = frozenset(
+    {
+        "part/create",
+        "part/update",
+        "part/delete",
+        "part/add-meta-part-ids",
+        "part/remove-meta-part-ids",
+        "part/add-substitute-ids",
+        "part/remove-substitute-ids",
+        "stock/add",
+        "stock/remove",
+        "stock/move",
+        "stock/update",
+        "lot/update",
+        "order/receive",
+    }
+)
+
+# Operations that change data returned by project/all
+_PROJECT_WRITE_OPERATIONS = frozenset(
+    {
+        "project/create",
+        "project/update",
+        "project/delete",
+        "project/archive",
+        "project/restore",
+        "project/add-entries",
+        "project/update-entries",
+        "project/delete-entries",
+    }
+)
+
+# Listing revalidated with If-None-Match, for each operation that changes it
+_INVALIDATED_LISTING = {
+    **dict.fromkeys(_PART_WRITE_OPERATIONS, "part/all"),
+    **dict.fromkeys(_PROJECT_WRITE_OPERATIONS, "project/all"),
+}
+
+
+# Read-only operations; identical concurrent requests for these share one
+# HTTP round trip (see PartsBoxClient._request)
+_READ_OPERATIONS = frozenset(
+    {
+        "part/get",
+        "part/storage",
+        "part/lots",
+        "part/stock",
+        "lot/all",
+        "lot/get",
+        "storage/all",
+        "storage/get",
+        "storage/parts",
+        "storage/lots",
+        "project/all",
+        "project/get",
+        "project/get-entries",
+        "project/get-builds",
+        "build/get",
+        "order/all",
+        "order/get",
+        "order/get-entries",
+    }
+)
+
+
 class PartsBoxClient:
     """HTTP client for the PartsBox API."""
 
@@ -170,43 +746,548 @@ class PartsBoxClient:
                 "Content-Type": "application/json",
             }
         )
+        self._session.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(pool_maxsize=MAX_CONCURRENT_REQUESTS),
+        )
+        # ETag and parsed body of the last part/all and project/all
+        # responses, so unchanged listings can be revalidated instead of
+        # downloaded and parsed again
+        self._validated: dict[str, tuple[str, list[dict[str, Any]]]] = {}
+        # Pending read requests, keyed by operation and payload
+        self._inflight: dict[tuple[str, str], Future] = {}
+        self._inflight_lock = threading.Lock()
 
     def _request(
         self, operation: str, data: dict[str, Any] | None = None
     ) -> dict[str, Any]:
-        """Make a request to the PartsBox API."""
+        """
+        Make a request to the PartsBox API.
+
+        Concurrent identical read requests are collapsed: the first caller
+        performs the request and the others wait for and share its parsed
+        response (or exception). Writes are always sent individually, and
+        once a write completes no later read joins a read that was already
+        in flight, since that read may have been answered before the write.
+        """
+        if operation not in _READ_OPERATIONS:
+            try:
+                return self._send(operation, data)
+            finally:
+                self._detach_inflight()
+
+        key = (operation, json.dumps(data or {}, sort_keys=True))
+        return self._single_flight(key, lambda: self._send(operation, data))
+
+    def _single_flight(self, key: tuple[str, str], fetch: Callable[[], _R]) -> _R:
+        """
+        Run fetch() unless an identical call is already in flight.
+
+        The first caller for a key runs fetch(); callers arriving before it
+        finishes wait for and share its result (or exception).
+        """
+        with self._inflight_lock:
+            pending = self._inflight.get(key)
+            if pending is None:
+                future: Future = Future()
+                self._inflight[key] = future
+        if pending is not None:
+            return pending.result()
+
+        try:
+            result = fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+
+    def _detach_inflight(self) -> None:
+        """
+        Stop later calls from joining the requests currently in flight.
+
+        Callers already waiting still receive those results; the next call
+        for the same key starts a new request.
+        """
+        with self._inflight_lock:
+            self._inflight.clear()
+
+    def _send(
+        self, operation: str, data: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Send one request to the PartsBox API and parse the JSON response."""
         url = f"{BASE_URL}/{operation}"
         response = self._session.post(url, json=data or {})
         response.raise_for_status()
+        listing = _INVALIDATED_LISTING.get(operation)
+        if listing is not None:
+            # Do not rely on the server's ETag after our own write
+            self._validated.pop(listing, None)
         return response.json()
 
     def _request_raw(
-        self, operation: str, data: dict[str, Any] | None = None
+        self,
+        operation: str,
+        data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
     ) -> requests.Response:
         """Make a request to the PartsBox API and return the raw response.
 
-        Use this for endpoints that return binary data (e.g., file downloads).
+        Use this for endpoints that return binary data (e.g., file downloads)
+        or when response headers and status are needed.
         """
         url = f"{BASE_URL}/{operation}"
-        response = self._session.post(url, json=data or {})
+        response = self._session.post(url, json=data or {}, headers=headers)
         response.raise_for_status()
         return response
 
     def get_all_parts(self) -> list[dict[str, Any]]:
-        """Fetch all parts from PartsBox."""
-        result = self._request("part/all")
-        return result.get("data", [])
+        """
+        Fetch all parts from PartsBox.
+
+        Short string values are interned (see _intern_strings) because the
+        catalog is held in the pagination cache across many paginated calls.
+
+        When the previous response carried an ETag, the request is sent with
+        If-None-Match; a 304 Not Modified returns the previously parsed list
+        (the same object), skipping the download and parse entirely.
+
+        Concurrent calls share one request, so a burst of list_parts calls
+        without a cache key downloads the catalog once.
+        """
+        return self._single_flight(
+            ("part/all", ""),
+            lambda: self._fetch_revalidated("part/all", _intern_strings),
+        )
+
+    def get_all_projects(self) -> list[dict[str, Any]]:
+        """
+        Fetch all projects from PartsBox.
+
+        Revalidated and collapsed like get_all_parts(): a 304 Not Modified
+        returns the previously parsed list object.
+        """
+        return self._single_flight(
+            ("project/all", ""), lambda: self._fetch_revalidated("project/all")
+        )
+
+    def _fetch_revalidated(
+        self,
+        operation: str,
+        parse: Callable[[list[dict[str, Any]]], list[dict[str, Any]]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Request a listing, revalidating against its last ETag when possible."""
+        validated = self._validated.get(operation)
+        headers = {"If-None-Match": validated[0]} if validated else None
+
+        try:
+            response = self._request_raw(operation, headers=headers)
+        except requests.RequestException:
+            if validated is None:
+                raise
+            # The server may refuse a conditional POST (e.g. 412); drop the
+            # validator so the listing does not keep failing, and retry once
+            self._validated.pop(operation, None)
+            validated = None
+            response = self._request_raw(operation)
+        if response.status_code == 304 and validated is not None:
+            return validated[1]
+
+        data = response.json().get("data", [])
+        if parse is not None:
+            data = parse(data)
+        etag = response.headers.get("ETag")
+        if etag:
+            self._validated[operation] = (etag, data)
+        else:
+            self._validated.pop(operation, None)
+        return data
 
     def get_part(self, part_id: str) -> dict[str, Any] | None:
         """Fetch a single part by ID."""
         result = self._request("part/get", {"part/id": part_id})
         return result.get("data")
 
+    def map_concurrent(
+        self, fn: Callable[[_T], _R], items: Iterable[_T]
+    ) -> list[_R]:
+        """
+        Apply a request-making function to each item, overlapping the requests.
+
+        The API has no batch read endpoints, so fetching several records is
+        one blocking round trip each. Running them on a small thread pool
+        over the shared session overlaps the network waits. Results are in
+        item order; fn should return errors rather than raise them.
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+        workers = min(MAX_CONCURRENT_REQUESTS, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(fn, items))
+
 
 # =============================================================================
 # JMESPath Query Support
 # =============================================================================
 
+# Matches a plain top-level sort on a single quoted field, e.g.
+# sort_by(@, &"order/created")
+_SORT_BY_FIELD = re.compile(r'^sort_by\(@,\s*&"([^"]+)"\)$')
+
+# Matches a single numeric comparison filter, e.g. [?"order/created" > `1700000000`]
+_NUMERIC_RANGE = re.compile(r'^\[\?\s*"([^"]+)"\s*([<>]=?)\s*`(-?\d+)`\s*\]$')
+
+# Matches a single null check filter, e.g. [?"order/arriving" != null]
+_NULL_CHECK = re.compile(r'^\[\?\s*"([^"]+)"\s*(==|!=)\s*null\s*\]$')
+
+# Matches a string equality filter, e.g. [?"part/manufacturer" == 'Yageo']
+_FIELD_EQUALS = re.compile(r'^\[\?\s*"([^"]+)"\s*==\s*\'([^\'\\]*)\'\s*\]$')
+
+# Matches an array membership filter, e.g. [?contains("part/tags", 'smd')]
+# or [?contains(nvl("part/tags", `[]`), 'smd')]
+_FIELD_CONTAINS = re.compile(
+    r'^\[\?\s*contains\(\s*(?:nvl\(\s*"([^"]+)"\s*,\s*`\[\]`\s*\)|"([^"]+)")'
+    r'\s*,\s*\'([^\'\\]*)\'\s*\)\s*\]$'
+)
+
+# Matches a string prefix filter, e.g. [?starts_with("part/mpn", 'RC0603')]
+# or [?starts_with(nvl("part/mpn", ''), 'RC0603')]
+_FIELD_STARTS_WITH = re.compile(
+    r'^\[\?\s*starts_with\(\s*(?:nvl\(\s*"([^"]+)"\s*,\s*\'\'\s*\)|"([^"]+)")'
+    r'\s*,\s*\'([^\'\\]*)\'\s*\)\s*\]$'
+)
+
+
+def _is_indexed_filter(expression: str) -> bool:
+    """Check whether PaginationCache answers a filter from an entry index."""
+    return any(
+        pattern.match(expression)
+        for pattern in (
+            _NUMERIC_RANGE,
+            _NULL_CHECK,
+            _FIELD_EQUALS,
+            _FIELD_CONTAINS,
+            _FIELD_STARTS_WITH,
+        )
+    )
+
+
+# Top-level AST node types that always yield a list when applied to a list
+_LIST_NODE_TYPES = frozenset({"projection", "filter_projection", "flatten"})
+
+# Functions whose result is always a list
+_LIST_FUNCTIONS = frozenset({"sort_by", "sort", "keys", "values"})
+
+
+@lru_cache(maxsize=256)
+def query_returns_list(expression: str) -> bool:
+    """
+    Predict from the parsed expression whether a query always yields a list.
+
+    Paginators use this to skip the aggregation-result check for the common
+    filter/projection/sort queries. A False result only means the shape is
+    not known to produce a list (e.g. length(@), [0], pipes), so callers must
+    still inspect the result.
+    """
+    try:
+        parsed = compile_expression(expression).parsed
+    except jmespath.exceptions.JMESPathError:
+        return False
+    node_type = parsed["type"]
+    if node_type in _LIST_NODE_TYPES:
+        return True
+    return node_type == "function_expression" and parsed["value"] in _LIST_FUNCTIONS
+
+
+# Row filters over lists at least this long are split across a process pool
+PARALLEL_QUERY_MIN_ROWS = 50_000
+
+_query_pool: ProcessPoolExecutor | None = None
+_query_pool_lock = threading.Lock()
+
+
+def _get_query_pool() -> ProcessPoolExecutor | None:
+    """
+    Return the shared query worker pool, creating it on first use.
+
+    Returns None on a single-CPU host, where splitting a filter across
+    worker processes only adds pickling and IPC on top of the serial scan.
+    """
+    global _query_pool
+    workers = os.cpu_count() or 1
+    if workers <= 1:
+        return None
+    with _query_pool_lock:
+        if _query_pool is None:
+            # spawn avoids forking a process that may hold HTTP/session threads
+            _query_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            atexit.register(_shutdown_query_pool)
+        return _query_pool
+
+
+def _shutdown_query_pool() -> None:
+    """Stop the query worker processes, if they were started."""
+    global _query_pool
+    with _query_pool_lock:
+        pool, _query_pool = _query_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Condition node types that never raise, whatever the row holds
+_SAFE_CONDITION_NODES = frozenset({"field", "literal", "comparator", "not_expression"})
+
+
+def _is_safe_condition(node: dict[str, Any]) -> bool:
+    """Check whether a filter condition can be evaluated on any row without error."""
+    return node["type"] in _SAFE_CONDITION_NODES and all(
+        _is_safe_condition(child) for child in node["children"]
+    )
+
+
+def _raw_matchable(literal: Any) -> bool:
+    """Check whether a literal appears verbatim in json.dumps() output of a match."""
+    return (
+        isinstance(literal, str)
+        and literal != ""
+        and '"' not in literal
+        and "\\" not in literal
+        and all(ch >= " " for ch in literal)
+    )
+
+
+def _contains_term(node: dict[str, Any]) -> tuple[str, str, bool] | None:
+    """
+    Match `contains("<field>", '<lit>')` or `contains(nvl("<field>", ''), '<lit>')`.
+
+    The nvl() default must be '' or `[]`, which never contain the literal.
+    Returns (field, literal, nvl_wrapped), or None for any other node.
+    """
+    if node["type"] != "function_expression" or node["value"] != "contains":
+        return None
+    subject, search = node["children"]
+    if search["type"] != "literal" or not _raw_matchable(search["value"]):
+        return None
+    if subject["type"] == "field":
+        return subject["value"], search["value"], False
+    if (
+        subject["type"] == "function_expression"
+        and subject["value"] == "nvl"
+        and subject["children"][0]["type"] == "field"
+        and subject["children"][1]["type"] == "literal"
+        and subject["children"][1]["value"] in ("", [])
+    ):
+        return subject["children"][0]["value"], search["value"], True
+    return None
+
+
+@lru_cache(maxsize=256)
+def _contains_prefilter(expression: str) -> tuple[tuple[str, str, bool], ...]:
+    """
+    Find contains() conditions that every row matched by a filter satisfies.
+
+    Applies to top-level filters over the input whose condition is a chain
+    of `&&` conjuncts. contains() conjuncts are collected up to the first
+    conjunct that could raise: JMESPath evaluates `&&` left to right, so a
+    row skipped by the prefilter could otherwise hide an error the full
+    scan would report. Callers must also check the fields' value types with
+    CacheEntry.is_text_field().
+
+    Returns:
+        (field, literal, nvl_wrapped) per usable conjunct; empty if none
+    """
+    try:
+        parsed = compile_expression(expression).parsed
+    except jmespath.exceptions.JMESPathError:
+        return ()
+    if (
+        parsed["type"] != "filter_projection"
+        or parsed["children"][0]["type"] != "identity"
+    ):
+        return ()
+
+    conjuncts = []
+    pending = [parsed["children"][2]]
+    while pending:
+        node = pending.pop()
+        if node["type"] == "and_expression":
+            pending.extend(reversed(node["children"]))
+        else:
+            conjuncts.append(node)
+
+    terms = []
+    for node in conjuncts:
+        term = _contains_term(node)
+        if term is not None:
+            terms.append(term)
+        elif not _is_safe_condition(node):
+            break
+    return tuple(terms)
+
+
+def _is_row_filter(expression: str) -> bool:
+    """
+    Check whether an expression is a top-level filter over the input list.
+
+    Filters like `[?"order/arriving" != null]` evaluate each row on its own,
+    so the input can be split into chunks and the results concatenated.
+    Anything else (sort_by, length, pipes, slices) needs the whole list.
+    """
+    try:
+        parsed = compile_expression(expression).parsed
+    except jmespath.exceptions.JMESPathError:
+        return False
+    return (
+        parsed["type"] == "filter_projection"
+        and parsed["children"][0]["type"] == "identity"
+    )
+
+
+def _parallel_filter(
+    data: list[dict[str, Any]], expression: str
+) -> tuple[Any, str | None] | None:
+    """
+    Evaluate a row filter across the query pool.
+
+    Returns None if the pool is unavailable so the caller can fall back to
+    evaluating the query in-process.
+    """
+    pool = _get_query_pool()
+    if pool is None:
+        return None
+    size = -(-len(data) // (os.cpu_count() or 1))
+    chunks = [data[i : i + size] for i in range(0, len(data), size)]
+    try:
+        parts = list(pool.map(search_chunk, [expression] * len(chunks), chunks))
+    except (BrokenProcessPool, OSError):
+        return None
+
+    result: list[Any] = []
+    for part, error in parts:
+        if error:
+            return ([], f"Invalid query expression: {error}")
+        result.extend(part or [])
+    return (result, None)
+
+
+def _pluck(field_name: str) -> Callable[[list[Any]], list[Any]]:
+    """Evaluate `[*]."<field>"`: the non-null field values of each row."""
+
+    def run(data: list[Any]) -> list[Any]:
+        return [
+            value
+            for row in data
+            if isinstance(row, dict) and (value := row.get(field_name)) is not None
+        ]
+
+    return run
+
+
+def _select_fields(pairs: tuple[tuple[str, str], ...]) -> Callable[[list[Any]], list[Any]]:
+    """Evaluate `[*].{<key>: "<field>", ...}` over top-level fields of each row."""
+
+    def run(data: list[Any]) -> list[Any]:
+        return [
+            {
+                key: row.get(field_name) if isinstance(row, dict) else None
+                for key, field_name in pairs
+            }
+            for row in data
+            if row is not None
+        ]
+
+    return run
+
+
+def _length(data: list[Any]) -> int:
+    """Evaluate `length(@)`."""
+    return len(data)
+
+
+@lru_cache(maxsize=256)
+def _fast_path(expression: str) -> Callable[[list[Any]], Any] | None:
+    """
+    Return a plain Python evaluator for trivial query shapes, if one applies.
+
+    Plucking one field, selecting top-level fields into objects and counting
+    rows are common enough that walking the JMESPath AST for every row is
+    wasted work. The evaluators reproduce JMESPath's results exactly for a
+    list input, including dropping null plucked values.
+    """
+    try:
+        parsed = compile_expression(expression).parsed
+    except jmespath.exceptions.JMESPathError:
+        return None
+
+    if (
+        parsed["type"] == "function_expression"
+        and parsed["value"] == "length"
+        and [child["type"] for child in parsed["children"]] == ["current"]
+    ):
+        return _length
+
+    if parsed["type"] != "projection" or parsed["children"][0]["type"] != "identity":
+        return None
+    right = parsed["children"][1]
+    if right["type"] == "field":
+        return _pluck(right["value"])
+    if right["type"] == "multi_select_dict":
+        pairs = []
+        for pair in right["children"]:
+            (value,) = pair["children"]
+            if value["type"] != "field":
+                return None
+            pairs.append((pair["value"], value["value"]))
+        return _select_fields(tuple(pairs))
+    return None
+
+
+# A backtick literal shaped like a namespaced field name, e.g. `part/name`.
+# Backticks create JSON literals, so such a query compares against the
+# string "part/name" and silently matches nothing (or projects constants).
+_BACKTICK_FIELD = re.compile(r"`(([a-zA-Z][\w-]*)/[\w?-]+)`")
+
+# Namespaces of PartsBox entity fields, e.g. the "part" in part/name
+_FIELD_NAMESPACES = frozenset(
+    {
+        "part",
+        "stock",
+        "lot",
+        "storage",
+        "source",
+        "project",
+        "entry",
+        "build",
+        "order",
+    }
+)
+
+
+def _backtick_field(data: list[dict[str, Any]], expression: str) -> str | None:
+    """
+    Return the first backtick literal in expression that names a field.
+
+    A literal only counts as a field name when its namespace is a PartsBox
+    entity namespace or it is a key of some row, so string values that
+    merely contain a slash, such as `N/A` or `I/O`, are left alone.
+    """
+    for match in _BACKTICK_FIELD.finditer(expression):
+        name, namespace = match.groups()
+        if namespace in _FIELD_NAMESPACES or any(
+            isinstance(row, dict) and name in row for row in data
+        ):
+            return name
+    return None
+
 
 def apply_query(
     data: list[dict[str, Any]], expression: str
@@ -228,10 +1309,44 @@ def apply_query(
         Tuple of (result, error_message)
         error_message is None on success
 
+    A blank expression returns the data unchanged.
+
+    Backtick-quoted field names such as `part/name` are rejected up front:
+    they are JSON literals, not field references, so the query could only
+    return wrong results after a full scan. Literal values that only look
+    similar, such as `N/A`, are evaluated normally.
+
     Example:
         # Safe filtering with nullable fields using nvl():
         apply_query(data, "[?contains(nvl(\"part/name\", ''), 'resistor')]")
     """
+    if not expression.strip():
+        return data, None
+
+    field_name = _backtick_field(data, expression) if "`" in expression else None
+    if field_name is not None:
+        return (
+            [],
+            "Invalid query expression: field identifiers must use double quotes, "
+            f'not backticks (use "{field_name}" instead of `{field_name}`)',
+        )
+
+    fast_path = _fast_path(expression) if isinstance(data, list) else None
+    if fast_path is not None:
+        return fast_path(data), None
+
+    row_filter = compile_row_filter(expression) if isinstance(data, list) else None
+    if row_filter is not None:
+        try:
+            return row_filter(data), None
+        except FilterFallback:
+            pass
+
+    if len(data) >= PARALLEL_QUERY_MIN_ROWS and _is_row_filter(expression):
+        parallel = _parallel_filter(data, expression)
+        if parallel is not None:
+            return parallel
+
     try:
         result = search_with_custom_functions(expression, data)
         return (result if result is not None else [], None)
@@ -248,3 +1363,45 @@ cache = PaginationCache()
 
 # Shared API client instance
 api_client = PartsBoxClient()
+
+
+# =============================================================================
+# Listing Helpers
+# =============================================================================
+
+
+def normalize_query(query: str | None) -> str | None:
+    """Return a listing's query stripped, or None if it is missing or blank."""
+    return query.strip() or None if query else None
+
+
+def paging_error(limit: int) -> str:
+    """Return the message for a limit/offset pair that failed validation."""
+    if not 1 <= limit <= 1000:
+        return "limit must be between 1 and 1000"
+    return "offset must be non-negative"
+
+
+def fetch_list(
+    endpoint: str, params: dict[str, Any] | None, cache_key: str | None
+) -> tuple[list[dict[str, Any]], str]:
+    """
+    Return the dataset for a listing, from the cache or a fresh fetch.
+
+    Cached data is reused when cache_key refers to a live entry; otherwise
+    the endpoint is requested and the result stored under a new key.
+
+    Returns:
+        Tuple of (data, cache_key)
+
+    Raises:
+        requests.RequestException: If the API request fails
+    """
+    if cache_key:
+        entry = cache.get(cache_key)
+        if entry:
+            return entry.data, cache_key
+
+    result = api_client._request(endpoint, params)
+    data = result.get("data", [])
+    return data, cache.create(data)
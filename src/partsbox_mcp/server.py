@@ -281,8 +281,8 @@ def list_parts(
             - CORRECT: "part/name", "part/tags", "part/mpn"
             - WRONG: `part/name` (backticks create literal strings, not field references)
 
-            Using backticks will silently fail - queries will return empty results because
-            `part/tags` evaluates to the literal string "part/tags", not the field value.
+            Queries using backticks are rejected with an error, because
+            `part/tags` would evaluate to the literal string "part/tags", not the field value.
 
             Standard JMESPath examples:
             - "[?\"part/manufacturer\" == 'Texas Instruments']" - filter by manufacturer
@@ -378,12 +378,16 @@ def list_parts(
 @mcp.tool()
 def get_part(
     part_id: Annotated[str, "Unique identifier of the part"],
+    cache_key: Annotated[str | None, "Serve the part from a list_parts cache entry"] = None,
 ) -> parts.PartResponse:
     """
     Get detailed information for a specific part.
 
     Args:
         part_id: The unique identifier of the part
+        cache_key: Optional cache key from list_parts. If the cached parts
+            include this part, it is returned without an API call; otherwise
+            the part is fetched fresh. Omit it when current stock is needed.
 
     Returns:
         PartResponse with part data or error.
@@ -451,7 +455,46 @@ def get_part(
     See Also:
         Use the get_image tool with the part/img-id field value to display part images
     """
-    return parts.get_part(part_id)
+    return parts.get_part(part_id, cache_key)
+
+
+@mcp.tool()
+def get_parts(
+    part_ids: Annotated[list[str], "Part identifiers to fetch (at most 100)"],
+    cache_key: Annotated[str | None, "Serve parts from a list_parts cache entry"] = None,
+) -> parts.PartBatchResponse:
+    """
+    Get detailed information for several parts in one call.
+
+    Parts are fetched concurrently, so this is much faster than calling
+    get_part once per part.
+
+    Args:
+        part_ids: The unique identifiers of the parts (at most 100)
+        cache_key: Optional cache key from list_parts. Parts present in the
+            cached list are returned without an API call; the rest are
+            fetched fresh.
+
+    Returns:
+        PartBatchResponse with one PartResponse per requested id, in request
+        order. Each item has its own success flag and error, so one missing
+        part does not fail the batch.
+
+        Data schema:
+        {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["success"],
+                "properties": {
+                    "success": {"type": "boolean"},
+                    "data": {"type": ["object", "null"], "description": "Part object, same schema as get_part data"},
+                    "error": {"type": ["string", "null"]}
+                }
+            }
+        }
+    """
+    return parts.get_parts(part_ids, cache_key)
 
 
 @mcp.tool()
@@ -823,6 +866,9 @@ def get_part_lots(
 @mcp.tool()
 def get_part_stock(
     part_id: Annotated[str, "Part identifier"],
+    cache_key: Annotated[
+        str | None, "Sum a get_part_storage/get_part_lots cache entry instead"
+    ] = None,
 ) -> parts.PartStockResponse:
     """
     Get the total stock count for a part.
@@ -832,6 +878,10 @@ def get_part_stock(
 
     Args:
         part_id: The part identifier
+        cache_key: Optional cache key from get_part_storage or get_part_lots
+            for the same part. The total is summed from the cached sources
+            without an API call when they are all on-hand stock; otherwise
+            (or if the key has expired) it is fetched fresh.
 
     Returns:
         PartStockResponse with the total stock count.
@@ -843,7 +893,37 @@ def get_part_stock(
             "error": null
         }
     """
-    return parts.get_part_stock(part_id)
+    return parts.get_part_stock(part_id, cache_key)
+
+
+@mcp.tool()
+def get_parts_stock(
+    part_ids: Annotated[list[str], "Part identifiers (at most 100)"],
+) -> parts.PartStockBatchResponse:
+    """
+    Get the total stock counts for several parts in one call.
+
+    Counts are fetched concurrently, so this is much faster than calling
+    get_part_stock once per part.
+
+    Args:
+        part_ids: The part identifiers (at most 100; duplicates are ignored)
+
+    Returns:
+        PartStockBatchResponse mapping each part id to its PartStockResponse.
+        Each item has its own success flag and error, so one failed lookup
+        does not fail the batch.
+
+        Response schema:
+        {
+            "success": true,
+            "data": {
+                "part_001": {"success": true, "total": 1500, "error": null}
+            },
+            "error": null
+        }
+    """
+    return parts.get_parts_stock(part_ids)
 
 
 # =============================================================================
@@ -1043,8 +1123,8 @@ def list_lots(
             - CORRECT: "lot/name", "lot/id", "lot/part-id"
             - WRONG: `lot/name` (backticks create literal strings, not field references)
 
-            Using backticks will silently fail - queries will return empty results because
-            `lot/name` evaluates to the literal string "lot/name", not the field value.
+            Queries using backticks are rejected with an error, because
+            `lot/name` would evaluate to the literal string "lot/name", not the field value.
 
             Standard JMESPath examples:
             - "[?\"lot/expiration-date\" != null]" - lots with expiration
@@ -1204,8 +1284,8 @@ def list_storage_locations(
             - CORRECT: "storage/name", "storage/id", "storage/archived"
             - WRONG: `storage/name` (backticks create literal strings, not field references)
 
-            Using backticks will silently fail - queries will return empty results because
-            `storage/name` evaluates to the literal string "storage/name", not the field value.
+            Queries using backticks are rejected with an error, because
+            `storage/name` would evaluate to the literal string "storage/name", not the field value.
 
             Standard JMESPath examples:
             - "[?\"storage/archived\" == `false`]" - active only
@@ -1437,8 +1517,8 @@ def list_storage_parts(
             - CORRECT: "source/quantity", "source/part-id", "source/status"
             - WRONG: `source/quantity` (backticks create literal strings, not field references)
 
-            Using backticks will silently fail - queries will return empty results because
-            `source/quantity` evaluates to the literal string "source/quantity", not the field value.
+            Queries using backticks are rejected with an error, because
+            `source/quantity` would evaluate to the literal string "source/quantity", not the field value.
 
             Standard JMESPath examples:
             - "[?\"source/quantity\" > `100`]" - parts with quantity > 100
@@ -1503,8 +1583,8 @@ def list_storage_lots(
             - CORRECT: "source/quantity", "source/lot-id", "source/status"
             - WRONG: `source/quantity` (backticks create literal strings, not field references)
 
-            Using backticks will silently fail - queries will return empty results because
-            `source/quantity` evaluates to the literal string "source/quantity", not the field value.
+            Queries using backticks are rejected with an error, because
+            `source/quantity` would evaluate to the literal string "source/quantity", not the field value.
 
             Standard JMESPath examples:
             - "[?\"source/quantity\" > `0`]" - lots with positive quantity
@@ -1573,8 +1653,8 @@ def list_projects(
             - CORRECT: "project/name", "project/id", "project/archived"
             - WRONG: `project/name` (backticks create literal strings, not field references)
 
-            Using backticks will silently fail - queries will return empty results because
-            `project/name` evaluates to the literal string "project/name", not the field value.
+            Queries using backticks are rejected with an error, because
+            `project/name` would evaluate to the literal string "project/name", not the field value.
 
             Standard JMESPath examples:
             - "[?\"project/archived\" == `false`]" - active projects only
@@ -1824,8 +1904,8 @@ def get_project_entries(
             - CORRECT: "entry/quantity", "entry/part-id", "entry/order"
             - WRONG: `entry/quantity` (backticks create literal strings, not field references)
 
-            Using backticks will silently fail - queries will return empty results because
-            `entry/quantity` evaluates to the literal string "entry/quantity", not the field value.
+            Queries using backticks are rejected with an error, because
+            `entry/quantity` would evaluate to the literal string "entry/quantity", not the field value.
 
             Standard JMESPath examples:
             - "[?\"entry/quantity\" > `10`]" - entries with quantity > 10
@@ -1968,8 +2048,8 @@ def get_project_builds(
             - CORRECT: "build/id", "build/project-id", "build/comments"
             - WRONG: `build/id` (backticks create literal strings, not field references)
 
-            Using backticks will silently fail - queries will return empty results because
-            `build/id` evaluates to the literal string "build/id", not the field value.
+            Queries using backticks are rejected with an error, because
+            `build/id` would evaluate to the literal string "build/id", not the field value.
 
             Standard JMESPath examples:
             - "sort_by(@, &\"build/id\")" - sort by build ID
@@ -2073,6 +2153,7 @@ def list_orders(
     offset: Annotated[int, "Starting index in query results"] = 0,
     cache_key: Annotated[str | None, "Reuse cached data from previous call"] = None,
     query: Annotated[str | None, "JMESPath expression for filtering/projection"] = None,
+    if_none_match: Annotated[str | None, "etag from a previous response for this page"] = None,
 ) -> orders.PaginatedOrdersResponse:
     """
     List all orders with optional JMESPath query and pagination.
@@ -2088,8 +2169,8 @@ def list_orders(
             - CORRECT: "order/vendor-name", "order/id", "order/created"
             - WRONG: `order/vendor-name` (backticks create literal strings, not field references)
 
-            Using backticks will silently fail - queries will return empty results because
-            `order/vendor-name` evaluates to the literal string "order/vendor-name", not the field value.
+            Queries using backticks are rejected with an error, because
+            `order/vendor-name` would evaluate to the literal string "order/vendor-name", not the field value.
 
             Standard JMESPath examples:
             - "[?\"order/arriving\" != null]" - orders with expected delivery
@@ -2105,8 +2186,17 @@ def list_orders(
             - "[?contains(nvl(\"order/vendor-name\", ''), 'Mouser')]" - safe vendor search
             - "[?contains(nvl(\"order/comments\", ''), 'urgent')]" - safe comments search
 
+        if_none_match: etag from a previous response. If the requested page is
+            unchanged, the response has unchanged=True and an empty data list.
+            Only meaningful on a fresh fetch without cache_key: a cache entry
+            is an immutable snapshot, so its pages always match their etag.
+
     Returns:
         PaginatedOrdersResponse with orders data and pagination info.
+        etag is a content hash of the page. It is set when the data was
+        freshly fetched or if_none_match was given, and is None for pages
+        served from cache_key. unchanged is True when the page matches
+        if_none_match; data is then empty.
 
         Data items schema:
         {
@@ -2131,6 +2221,7 @@ def list_orders(
         offset=offset,
         cache_key=cache_key,
         query=query,
+        if_none_match=if_none_match,
     )
 
 
@@ -2220,6 +2311,7 @@ def get_order_entries(
     offset: Annotated[int, "Starting index in query results"] = 0,
     cache_key: Annotated[str | None, "Reuse cached data from previous call"] = None,
     query: Annotated[str | None, "JMESPath expression for filtering/projection"] = None,
+    if_none_match: Annotated[str | None, "etag from a previous response for this page"] = None,
 ) -> orders.PaginatedOrderEntriesResponse:
     """
     List stock items in an order.
@@ -2236,8 +2328,8 @@ def get_order_entries(
             - CORRECT: "stock/quantity", "stock/part-id", "stock/price"
             - WRONG: `stock/quantity` (backticks create literal strings, not field references)
 
-            Using backticks will silently fail - queries will return empty results because
-            `stock/quantity` evaluates to the literal string "stock/quantity", not the field value.
+            Queries using backticks are rejected with an error, because
+            `stock/quantity` would evaluate to the literal string "stock/quantity", not the field value.
 
             Standard JMESPath examples:
             - "[?\"stock/quantity\" > `100`]" - entries with quantity > 100
@@ -2253,8 +2345,17 @@ def get_order_entries(
             - "[?nvl(\"stock/currency\", '') == 'USD']" - safe currency check
             - "[?contains(nvl(\"stock/comments\", ''), 'priority')]" - safe comments search
 
+        if_none_match: etag from a previous response. If the requested page is
+            unchanged, the response has unchanged=True and an empty data list.
+            Only meaningful on a fresh fetch without cache_key: a cache entry
+            is an immutable snapshot, so its pages always match their etag.
+
     Returns:
         PaginatedOrderEntriesResponse with order entries and pagination info.
+        etag is a content hash of the page. It is set when the data was
+        freshly fetched or if_none_match was given, and is None for pages
+        served from cache_key. unchanged is True when the page matches
+        if_none_match; data is then empty.
 
         Data items schema:
         {
@@ -2282,6 +2383,7 @@ def get_order_entries(
         offset=offset,
         cache_key=cache_key,
         query=query,
+        if_none_match=if_none_match,
     )
 
 
@@ -0,0 +1,147 @@
+"""
+Coalescing of concurrent list-valued write requests.
+
+Several PartsBox operations take a target id plus a list of items (ids to
+link to a part, BOM entries to add to a project, ...). Sync tools run in a
+thread pool, so an agent issuing several such calls for one target can have
+them in flight at once. RequestBatcher merges those calls: while a request
+for a key is in flight, further calls for that key join a single queued
+batch, which is sent as one request when the in-flight one finishes. A call
+with nothing in flight is sent immediately, so there is no added latency.
+
+The API accepts or rejects a request as a whole, so one caller's bad item
+would fail every caller in a merged batch. When the API definitively rejects
+a merged request (a 4xx response), nothing was applied, so each caller's
+items are resent on their own and every caller receives the outcome of its
+own items. Any other failure (connection error, timeout, 5xx) may have been
+applied server-side; resending could apply non-idempotent operations such as
+adding BOM entries twice, so that error is raised in every caller unchanged.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable, TypeVar
+
+import requests
+
+_R = TypeVar("_R")
+
+
+def _is_rejection(error: BaseException) -> bool:
+    """Return whether error is a 4xx response, i.e. a request the API did not apply."""
+    response = getattr(error, "response", None)
+    return (
+        isinstance(error, requests.HTTPError)
+        and response is not None
+        and 400 <= response.status_code < 500
+    )
+
+
+@dataclass
+class _Batch:
+    """Calls queued for one request, in the order the callers joined."""
+
+    calls: list[list[Any]] = field(default_factory=list)
+    ready: threading.Event = field(default_factory=threading.Event)
+    done: threading.Event = field(default_factory=threading.Event)
+    # Per caller: (True, response) or (False, exception raised by send)
+    outcomes: list[tuple[bool, Any]] | None = None
+    error: BaseException | None = None
+
+
+class RequestBatcher:
+    """
+    Merge concurrent calls for the same key into one request.
+
+    Args:
+        dedupe: Drop repeated items from the merged request (for id lists,
+            where adding or removing an id twice is redundant)
+    """
+
+    def __init__(self, dedupe: bool = False) -> None:
+        self._dedupe = dedupe
+        self._lock = threading.Lock()
+        self._in_flight: set[Hashable] = set()
+        self._queued: dict[Hashable, _Batch] = {}
+
+    def submit(
+        self, key: Hashable, items: list[Any], send: Callable[[list[Any]], _R]
+    ) -> _R:
+        """
+        Send items through send(), merged with concurrent calls for the same key.
+
+        send() receives the item list for one request and returns its
+        response, raising on failure. The caller gets the exception raised
+        for its items: a 4xx rejection of a merged request is retried per
+        caller, and any other exception is raised in every caller.
+        """
+        with self._lock:
+            batch = self._queued.get(key)
+            owner = batch is None
+            if batch is None:
+                batch = _Batch()
+                if key in self._in_flight:
+                    self._queued[key] = batch
+                else:
+                    self._in_flight.add(key)
+                    batch.ready.set()
+            index = len(batch.calls)
+            batch.calls.append(list(items))
+
+        if not owner:
+            batch.done.wait()
+            return self._outcome(batch, index)
+
+        # Once ready is set the batch has left the queue, so no more callers
+        # can join it
+        batch.ready.wait()
+        try:
+            batch.outcomes = self._send_batch(batch.calls, send)
+        except BaseException as e:
+            batch.error = e
+            raise
+        finally:
+            # Hand the key over to the next queued batch, if any
+            with self._lock:
+                following = self._queued.pop(key, None)
+                if following is None:
+                    self._in_flight.discard(key)
+            batch.done.set()
+            if following is not None:
+                following.ready.set()
+        return self._outcome(batch, index)
+
+    @staticmethod
+    def _outcome(batch: _Batch, index: int) -> Any:
+        """Return the response for one caller of a batch, or raise its error."""
+        if batch.error is not None:
+            raise batch.error
+        ok, value = batch.outcomes[index]
+        if not ok:
+            raise value
+        return value
+
+    def _merge(self, calls: list[list[Any]]) -> list[Any]:
+        """Return the items of several calls as one request's item list."""
+        merged = [item for call in calls for item in call]
+        return list(dict.fromkeys(merged)) if self._dedupe else merged
+
+    def _send_batch(
+        self, calls: list[list[Any]], send: Callable[[list[Any]], _R]
+    ) -> list[tuple[bool, Any]]:
+        """Send a batch, falling back to one request per caller on rejection."""
+        try:
+            result = send(self._merge(calls))
+        except Exception as e:
+            if len(calls) == 1 or not _is_rejection(e):
+                return [(False, e)] * len(calls)
+            return [self._attempt(send, self._merge([call])) for call in calls]
+        return [(True, result)] * len(calls)
+
+    @staticmethod
+    def _attempt(send: Callable[[list[Any]], _R], items: list[Any]) -> tuple[bool, Any]:
+        """Send one caller's items, capturing the exception instead of raising."""
+        try:
+            return True, send(items)
+        except Exception as e:
+            return False, e
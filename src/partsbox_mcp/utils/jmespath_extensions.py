@@ -31,10 +31,23 @@ For string defaults, use single quotes:
     CORRECT: nvl("part/name", '')     ← single quotes for empty string
 """
 
+import operator
 import re
+from functools import lru_cache
+from typing import Any, Callable, Optional, Union
+
 import jmespath
 from jmespath import functions
-from typing import Any, Optional, Union
+from jmespath.parser import ParsedResult
+
+# Reused so compiled filters compare values exactly as the interpreter does
+from jmespath.visitor import _equals, _is_actual_number, _is_comparable
+
+
+# regex_replace() is called once per row with the same literal pattern, so
+# compiled patterns are kept here rather than relying on re's internal cache,
+# which re-checks flags and pattern type on every lookup
+_compile_pattern = lru_cache(maxsize=128)(re.compile)
 
 
 class CustomFunctions(functions.Functions):
@@ -70,7 +83,7 @@ class CustomFunctions(functions.Functions):
         if value is None:
             return None
         try:
-            return re.sub(pattern, replacement, value)
+            return _compile_pattern(pattern).sub(replacement, value)
         except (re.error, TypeError):
             # Invalid regex pattern or null value - return original unchanged
             return value
@@ -99,8 +112,6 @@ class CustomFunctions(functions.Functions):
         if value is None:
             return None
         try:
-            if isinstance(value, (int, float)):
-                return int(value)
             return int(value)
         except (ValueError, TypeError):
             return None
@@ -176,10 +187,302 @@ class CustomFunctions(functions.Functions):
         return value
 
 
-# Create a shared options object with custom functions registered
+# Create a shared options object with custom functions registered.
+# CustomFunctions holds no per-call state, so one instance is safe to share.
 _custom_options = jmespath.Options(custom_functions=CustomFunctions())
 
 
+@lru_cache(maxsize=256)
+def compile_expression(expression: str) -> ParsedResult:
+    """
+    Compile a JMESPath expression, reusing the parsed AST for repeat queries.
+
+    Paginated tool calls usually repeat the same query string for every
+    page, so the parse cost is paid once per distinct expression.
+
+    Raises:
+        jmespath.exceptions.ParseError: If the expression is invalid
+    """
+    return jmespath.compile(expression)
+
+
+@lru_cache(maxsize=256)
+def compile_row_predicate(expression: str) -> Optional[ParsedResult]:
+    """
+    Compile the condition of a plain row filter such as `[?"part/mpn" != null]`.
+
+    Returns None unless the expression is a top-level filter over the input
+    list that yields the matching rows themselves, i.e. each row can be
+    tested on its own and kept or dropped without any projection.
+    """
+    try:
+        parsed = compile_expression(expression).parsed
+    except jmespath.exceptions.JMESPathError:
+        return None
+    if (
+        parsed["type"] == "filter_projection"
+        and parsed["children"][0]["type"] == "identity"
+        and parsed["children"][1]["type"] == "identity"
+    ):
+        return ParsedResult(expression, parsed["children"][2])
+    return None
+
+
+def row_matches(predicate: ParsedResult, row: Any) -> bool:
+    """Evaluate a row predicate using JMESPath (not Python) truthiness."""
+    value = predicate.search(row, options=_custom_options)
+    return not (
+        value == "" or value == [] or value == {} or value is None or value is False
+    )
+
+
+class FilterFallback(Exception):
+    """Raised by a compiled filter when only the interpreter can produce the result."""
+
+
+_ORDERING_OPS = {
+    "lt": operator.lt,
+    "gt": operator.gt,
+    "lte": operator.le,
+    "gte": operator.ge,
+}
+
+
+def _is_false(value: Any) -> bool:
+    """JMESPath falsiness: empty string/array/object, null and false."""
+    return value == "" or value == [] or value == {} or value is None or value is False
+
+
+def _compile_field_comparison(node: dict[str, Any]) -> Optional[Callable[[Any], Any]]:
+    """
+    Compile `"<field>" <op> <literal>` into a single closure.
+
+    This is the most common filter condition. Reading the field and
+    comparing it inline avoids two closure calls and the generic _equals()
+    / _is_comparable() checks per row. Only literals whose comparison
+    semantics are plain Python ones are fused: strings and null for
+    ==/!=, numbers for ordering operators. Returns None otherwise.
+    """
+    left, right = node["children"]
+    if left["type"] != "field" or right["type"] != "literal":
+        return None
+    name, literal, op = left["value"], right["value"], node["value"]
+
+    if op in ("eq", "ne") and (literal is None or isinstance(literal, str)):
+        if op == "eq":
+            return lambda value: (
+                value.get(name) if isinstance(value, dict) else None
+            ) == literal
+        return lambda value: (
+            value.get(name) if isinstance(value, dict) else None
+        ) != literal
+
+    if op in _ORDERING_OPS and _is_actual_number(literal):
+        compare = _ORDERING_OPS[op]
+
+        def ordering(value: Any) -> Optional[bool]:
+            field_value = value.get(name) if isinstance(value, dict) else None
+            if _is_actual_number(field_value):
+                return compare(field_value, literal)
+            if isinstance(field_value, str):
+                # Let the interpreter raise its type error
+                raise FilterFallback()
+            return None
+
+        return ordering
+
+    return None
+
+
+def _compile_node(node: dict[str, Any]) -> Callable[[Any], Any]:
+    """
+    Compile one condition node into a function of the current value.
+
+    Each function returns exactly what TreeInterpreter would for the node.
+    Raises NotImplementedError for node types that are not supported.
+    """
+    node_type = node["type"]
+    children = node["children"]
+
+    if node_type == "field":
+        name = node["value"]
+        return lambda value: value.get(name) if isinstance(value, dict) else None
+
+    if node_type == "literal":
+        literal = node["value"]
+        return lambda value: literal
+
+    if node_type == "current":
+        return lambda value: value
+
+    if node_type == "subexpression":
+        steps = [_compile_node(child) for child in children]
+
+        def subexpression(value: Any) -> Any:
+            for step in steps:
+                value = step(value)
+            return value
+
+        return subexpression
+
+    if node_type in ("and_expression", "or_expression"):
+        left, right = (_compile_node(child) for child in children)
+        if node_type == "and_expression":
+            return lambda value: (
+                matched if _is_false(matched := left(value)) else right(value)
+            )
+        return lambda value: (
+            right(value) if _is_false(matched := left(value)) else matched
+        )
+
+    if node_type == "not_expression":
+        (child,) = (_compile_node(child) for child in children)
+
+        def not_expression(value: Any) -> bool:
+            result = child(value)
+            if _is_actual_number(result) and result == 0:
+                return False
+            return not result
+
+        return not_expression
+
+    if node_type == "comparator":
+        fused = _compile_field_comparison(node)
+        if fused is not None:
+            return fused
+        left, right = (_compile_node(child) for child in children)
+        op = node["value"]
+        if op == "eq":
+            return lambda value: _equals(left(value), right(value))
+        if op == "ne":
+            return lambda value: not _equals(left(value), right(value))
+        compare = _ORDERING_OPS[op]
+
+        def ordering(value: Any) -> Optional[bool]:
+            lhs, rhs = left(value), right(value)
+            if not (_is_comparable(lhs) and _is_comparable(rhs)):
+                return None
+            if isinstance(lhs, str) != isinstance(rhs, str):
+                # Let the interpreter raise its type error
+                raise FilterFallback()
+            return compare(lhs, rhs)
+
+        return ordering
+
+    if node_type == "function_expression" and len(children) == 2:
+        first, second = (_compile_node(child) for child in children)
+        if node["value"] == "contains":
+
+            def contains(value: Any) -> bool:
+                subject = first(value)
+                if not isinstance(subject, (list, str)):
+                    # Let the interpreter raise its type error
+                    raise FilterFallback()
+                return second(value) in subject
+
+            return contains
+
+        if node["value"] == "nvl":
+
+            def nvl(value: Any) -> Any:
+                default = second(value)
+                if default is None:
+                    raise FilterFallback()
+                result = first(value)
+                return default if result is None else result
+
+            return nvl
+
+    raise NotImplementedError(node_type)
+
+
+@lru_cache(maxsize=256)
+def compile_row_filter(expression: str) -> Optional[Callable[[list[Any]], list[Any]]]:
+    """
+    Compile a plain row filter such as `[?"part/type" == 'local']` to Python.
+
+    The interpreter walks the condition's AST and dispatches on node type for
+    every row. For filters built only from fields, literals, comparisons,
+    &&/||/!, contains() and nvl(), the condition is instead compiled once into
+    nested closures that reproduce the interpreter's semantics. The returned
+    function raises FilterFallback when a row needs the interpreter (to
+    raise a type error); callers then evaluate the query with JMESPath.
+
+    Returns None for any other expression.
+    """
+    predicate = compile_row_predicate(expression)
+    if predicate is None:
+        return None
+    node = predicate.parsed
+    try:
+        condition = _compile_node(node)
+    except NotImplementedError:
+        return None
+
+    # Comparisons and negations yield True, False or None, so Python
+    # truthiness matches JMESPath's for them
+    plain_truth = node["type"] in ("comparator", "not_expression")
+
+    def run(data: list[Any]) -> list[Any]:
+        if plain_truth:
+            return [row for row in data if condition(row)]
+        return [row for row in data if not _is_false(condition(row))]
+
+    return _inline_field_filter(node, run) or run
+
+
+def _inline_field_filter(
+    node: dict[str, Any], fallback: Callable[[list[Any]], list[Any]]
+) -> Optional[Callable[[list[Any]], list[Any]]]:
+    """
+    Compile `[?"<field>" <op> <literal>]` to a bare comprehension.
+
+    The comparison runs inline in the comprehension, with no per-row
+    function call, which makes it several times faster than calling a
+    compiled condition per row. Covers ==/!= against a string and ordering
+    against a number. An ordering comprehension that hits a value Python
+    cannot compare (a string, array or object) reruns the rows through
+    `fallback`, which applies the exact JMESPath rules. Returns None for
+    any other condition.
+    """
+    if node["type"] != "comparator":
+        return None
+    left, right = node["children"]
+    if left["type"] != "field" or right["type"] != "literal":
+        return None
+    name, literal, op = left["value"], right["value"], node["value"]
+
+    if op in ("eq", "ne") and isinstance(literal, str):
+        if op == "eq":
+            return lambda data: [
+                row for row in data if isinstance(row, dict) and row.get(name) == literal
+            ]
+        return lambda data: [
+            row for row in data if not isinstance(row, dict) or row.get(name) != literal
+        ]
+
+    if op in _ORDERING_OPS and _is_actual_number(literal):
+        compare = _ORDERING_OPS[op]
+
+        def ordering(data: list[Any]) -> list[Any]:
+            try:
+                return [
+                    row
+                    for row in data
+                    if isinstance(row, dict)
+                    and (value := row.get(name)) is not None
+                    and value is not True
+                    and value is not False
+                    and compare(value, literal)
+                ]
+            except TypeError:
+                return fallback(data)
+
+        return ordering
+
+    return None
+
+
 def search_with_custom_functions(expression: str, data: Any) -> Any:
     """
     Execute a JMESPath query with custom functions enabled.
@@ -208,4 +511,27 @@ def search_with_custom_functions(expression: str, data: Any) -> Any:
         >>> search_with_custom_functions("nvl(price, 'N/A')", data)
         'N/A'
     """
-    return jmespath.search(expression, data, options=_custom_options)
+    return compile_expression(expression).search(data, options=_custom_options)
+
+
+def search_chunk(expression: str, chunk: list[Any]) -> tuple[Any, Optional[str]]:
+    """
+    Evaluate a JMESPath expression against one chunk of a larger list.
+
+    This is the worker entry point used when a row filter is spread across a
+    process pool. It lives here rather than in the client module so worker
+    processes only import the query machinery, not the API client.
+
+    Args:
+        expression: JMESPath expression (a top-level filter projection)
+        chunk: Contiguous slice of the rows being filtered
+
+    Returns:
+        Tuple of (result, error_message); error_message is None on success.
+        Errors are returned as strings because JMESPath exceptions do not
+        survive pickling back to the parent process.
+    """
+    try:
+        return search_with_custom_functions(expression, chunk), None
+    except jmespath.exceptions.JMESPathError as e:
+        return None, str(e)
@@ -0,0 +1,136 @@
+"""
+Unit tests for the batching utilities.
+
+Tests cover:
+- RequestBatcher: Merging concurrent calls for the same key
+- RequestBatcher: Per-caller retry of rejected batches, and no retry of
+  failures the API may have applied
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from partsbox_mcp.utils.batching import RequestBatcher
+
+
+def _http_error(status: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(f"{status} Error", response=response)
+
+
+class TestRequestBatcher:
+    """Tests for RequestBatcher."""
+
+    def _run(self, batcher, send, calls):
+        """
+        Submit calls under one key while the first one is held in flight.
+
+        The first call is sent alone; the rest queue behind it and are
+        merged. Returns each call's result, or the exception it raised.
+        """
+        release = threading.Event()
+        first_sent = threading.Event()
+
+        def gated_send(items):
+            if not first_sent.is_set():
+                first_sent.set()
+                release.wait(timeout=5)
+            return send(items)
+
+        def call(items):
+            try:
+                return batcher.submit("key", items, gated_send)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+            futures = [pool.submit(call, calls[0])]
+            assert first_sent.wait(timeout=5)
+            futures += [pool.submit(call, items) for items in calls[1:]]
+            time.sleep(0.1)
+            release.set()
+            return [f.result() for f in futures]
+
+    def test_call_with_nothing_in_flight_is_sent_alone(self):
+        """A single call is sent immediately with its own items."""
+        sent = []
+
+        def send(items):
+            sent.append(items)
+            return "ok"
+
+        assert RequestBatcher().submit("key", ["a"], send) == "ok"
+        assert sent == [["a"]]
+
+    def test_concurrent_calls_share_one_request(self):
+        """Calls made while a request is in flight are merged into the next one."""
+        sent = []
+
+        def send(items):
+            sent.append(items)
+            return len(sent)
+
+        results = self._run(
+            RequestBatcher(dedupe=True), send, [["a"], ["b", "c"], ["c", "d"]]
+        )
+
+        assert results[0] == 1
+        assert results[1:] == [2, 2]
+        assert sent[0] == ["a"]
+        assert sorted(sent[1]) == ["b", "c", "d"]
+        assert len(sent) == 2
+
+    def test_rejected_batch_is_resent_per_caller(self):
+        """A 4xx on a merged request is retried so each caller gets its own result."""
+        sent = []
+
+        def send(items):
+            sent.append(items)
+            if "bad" in items:
+                raise _http_error(400)
+            return "ok"
+
+        results = self._run(RequestBatcher(), send, [["a"], ["b"], ["bad"]])
+
+        assert results[:2] == ["ok", "ok"]
+        assert isinstance(results[2], requests.HTTPError)
+        assert sorted(sent[1]) == ["b", "bad"]
+        assert sorted(sent[2:]) == [["b"], ["bad"]]
+
+    @pytest.mark.parametrize(
+        "error",
+        [_http_error(502), requests.ConnectionError("boom"), requests.Timeout("slow")],
+        ids=["5xx", "connection", "timeout"],
+    )
+    def test_possibly_applied_failure_is_not_resent(self, error):
+        """A failure the API may have applied is raised in every caller unchanged."""
+        sent = []
+
+        def send(items):
+            sent.append(items)
+            if len(sent) > 1:
+                raise error
+            return "ok"
+
+        results = self._run(RequestBatcher(), send, [["a"], ["b"], ["c"]])
+
+        assert results[0] == "ok"
+        assert results[1] is error and results[2] is error
+        assert len(sent) == 2
+
+    def test_key_is_released_after_error(self):
+        """A failed request does not leave its key blocking later calls."""
+        batcher = RequestBatcher()
+
+        def failing(items):
+            raise requests.ConnectionError("boom")
+
+        with pytest.raises(requests.ConnectionError):
+            batcher.submit("key", ["a"], failing)
+
+        assert batcher.submit("key", ["b"], lambda items: items) == ["b"]
@@ -0,0 +1,527 @@
+"""
+Unit tests for the client module.
+
+Tests cover:
+- apply_query: JMESPath evaluation, including the parallel row-filter path
+- _fast_path: Plain Python evaluation of trivial query shapes
+- _intern_strings: Sharing repeated string values in the parts catalog
+- PaginationCache.apply_query: Index-backed query shapes on cache entries
+- PaginationCache.filter_page: Early-stopping pages of row filters
+- PaginationCache query result memo
+- Raw-text prefiltering of contains() row filters
+- query_returns_list: AST-based result shape prediction
+- PartsBoxClient._request: Collapsing concurrent identical reads
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from partsbox_mcp import client
+from partsbox_mcp.client import apply_query
+from partsbox_mcp.utils.jmespath_extensions import search_with_custom_functions
+from tests.fake_partsbox import get_sample_parts
+
+
+class TestApplyQuery:
+    """Tests for the apply_query helper."""
+
+    def test_blank_expression_returns_data(self):
+        """A whitespace-only expression is a no-op rather than a parse error."""
+        data = get_sample_parts()
+
+        assert apply_query(data, "  ") == (data, None)
+
+    def test_backtick_data_key_rejected(self):
+        """A backtick literal naming a key of the data is rejected."""
+        data = [{"custom/size": "N/A"}]
+
+        result, error = apply_query(data, "[?`custom/size` == 'N/A']")
+
+        assert result == []
+        assert '"custom/size"' in error
+
+    def test_backtick_value_not_rejected(self):
+        """A slash-containing literal that is neither a known namespace nor a key is a value."""
+        data = [{"custom/size": "N/A"}, {"custom/size": "0805"}]
+
+        result, error = apply_query(data, '[?"custom/size" == `N/A`]')
+
+        assert error is None
+        assert result == [data[0]]
+
+    def test_parallel_filter_matches_serial(self, monkeypatch):
+        """Row filters split across the pool return the same rows in order."""
+        data = get_sample_parts() * 4
+        # starts_with() is not compiled, so the query is not served in-process
+        query = (
+            "[?starts_with(nvl(\"part/name\", ''), '1') && \"part/type\" == 'local']"
+        )
+        expected, _ = apply_query(data, query)
+        calls = []
+        parallel_filter = client._parallel_filter
+
+        def spy(rows, expression):
+            outcome = parallel_filter(rows, expression)
+            calls.append(outcome)
+            return outcome
+
+        monkeypatch.setattr(client, "PARALLEL_QUERY_MIN_ROWS", 2)
+        monkeypatch.setattr(client.os, "cpu_count", lambda: 2)
+        monkeypatch.setattr(client, "_parallel_filter", spy)
+        result, error = apply_query(data, query)
+
+        assert calls == [(expected, None)]
+        assert error is None
+        assert len(expected) == 12
+        assert result == expected
+
+    def test_parallel_filter_reports_query_errors(self, monkeypatch):
+        """Type errors raised in workers surface as query errors."""
+        monkeypatch.setattr(client, "PARALLEL_QUERY_MIN_ROWS", 2)
+        monkeypatch.setattr(client.os, "cpu_count", lambda: 2)
+        result, error = apply_query(get_sample_parts(), '[?contains("part/created", \'x\')]')
+
+        assert result == []
+        assert "Invalid query expression" in error
+
+    def test_single_cpu_skips_pool(self, monkeypatch):
+        """With one CPU the filter runs in-process and no pool is started."""
+        monkeypatch.setattr(client.os, "cpu_count", lambda: 1)
+        monkeypatch.setattr(client, "_query_pool", None)
+
+        assert client._parallel_filter(get_sample_parts(), '[?"part/type" == \'local\']') is None
+        assert client._query_pool is None
+
+    def test_non_filter_queries_stay_serial(self, monkeypatch):
+        """Whole-list queries never reach the pool."""
+        monkeypatch.setattr(client, "PARALLEL_QUERY_MIN_ROWS", 2)
+        monkeypatch.setattr(client, "_parallel_filter", pytest.fail)
+
+        result, error = apply_query(get_sample_parts(), "length(@)")
+
+        assert error is None
+        assert result == len(get_sample_parts())
+
+
+class TestFastPath:
+    """Tests for the plain Python evaluators of trivial query shapes."""
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            '[*]."part/mpn"',
+            "[*].n",
+            '[*].{name: "part/name", mpn: "part/mpn", missing: nope}',
+            "length(@)",
+        ],
+    )
+    def test_matches_jmespath(self, query):
+        """Fast-path results equal the JMESPath engine's, including odd rows."""
+        data = get_sample_parts() + [{"n": 1}, {"n": None}, 5, None, "s"]
+
+        assert client._fast_path(query) is not None
+        assert apply_query(data, query) == (search_with_custom_functions(query, data), None)
+
+    @pytest.mark.parametrize(
+        "query",
+        ['[*].stock[0]', '[*].{n: nvl(n, `0`)}', 'length("part/tags")', "[].n", '[?n]."n"'],
+    )
+    def test_other_shapes_use_jmespath(self, query):
+        """Nested paths, functions, flattens and filters are not fast-pathed."""
+        assert client._fast_path(query) is None
+
+
+class TestInternStrings:
+    """Tests for _intern_strings, applied to the fetched parts catalog."""
+
+    def test_short_values_share_one_object(self):
+        """Equal short strings in different rows become the same object."""
+        data = json.loads('[{"m": "Yageo", "t": ["smd"]}, {"m": "Yageo", "t": ["smd"]}]')
+        assert data[0]["m"] is not data[1]["m"]
+
+        result = client._intern_strings(data)
+
+        assert result is data
+        assert data[0]["m"] is data[1]["m"]
+        assert data[0]["t"][0] is data[1]["t"][0]
+
+    def test_long_values_and_structure_unchanged(self):
+        """Long strings are left alone and the document compares equal."""
+        note = "x" * (client._INTERN_MAX_LENGTH + 1)
+        data = json.loads(json.dumps([{"n": note, "s": [{"q": 1, "u": None}]}] * 2))
+        expected = json.loads(json.dumps(data))
+
+        client._intern_strings(data)
+
+        assert data == expected
+        assert data[0]["n"] is not data[1]["n"]
+
+
+class TestPaginationCacheQuery:
+    """Tests for PaginationCache.apply_query index-backed query shapes."""
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            '[?"part/created" > `1700000000000`]',
+            '[?"part/created" >= `1700000000000`]',
+            '[?"part/created" < `1700000000000`]',
+            '[?"part/created" <= `1700000000000`]',
+            '[?"part/mpn" != null]',
+            '[?"part/img-id" == null]',
+            '[?"part/type" == \'local\']',
+            '[?"part/mpn" == \'no-such-mpn\']',
+            '[?contains(nvl("part/tags", `[]`), \'resistor\')]',
+            '[?starts_with(nvl("part/mpn", \'\'), \'RC\')]',
+            '[?starts_with("part/name", \'Res\')]',
+        ],
+    )
+    def test_indexed_filters_match_jmespath(self, query):
+        """Index-backed filters return the same rows, in the same order."""
+        data = get_sample_parts()
+        cache = client.PaginationCache()
+        key = cache.create(data)
+
+        expected, _ = apply_query(data, query)
+        result, error = cache.apply_query(key, data, query)
+
+        assert error is None
+        assert result == expected
+
+    def test_range_filter_skips_non_numeric_values(self):
+        """Rows with missing, null or boolean values never match a range."""
+        data = [{"n": 5}, {"n": None}, {}, {"n": True}, {"n": "7"}, {"n": 3}]
+        cache = client.PaginationCache()
+        key = cache.create(data)
+
+        result, _ = cache.apply_query(key, data, '[?"n" > `0`]')
+
+        assert result == [{"n": 5}, {"n": 3}]
+
+    def test_contains_filter_indexes_arrays_once_per_row(self):
+        """Duplicate array elements do not duplicate the matching row."""
+        data = [{"t": ["a", "a"]}, {"t": ["b"]}, {"t": None}, {"t": ["a"]}]
+        cache = client.PaginationCache()
+        key = cache.create(data)
+
+        result, error = cache.apply_query(key, data, '[?contains(nvl("t", `[]`), \'a\')]')
+
+        assert error is None
+        assert result == [data[0], data[3]]
+
+    @pytest.mark.parametrize(
+        "data", [[{"t": ["a"]}, {"t": None}], [{"t": ["a"]}, {"t": "abc"}]]
+    )
+    def test_contains_filter_defers_to_jmespath(self, data):
+        """Null or string fields fall back to JMESPath semantics."""
+        cache = client.PaginationCache()
+        key = cache.create(data)
+        query = '[?contains("t", \'a\')]'
+
+        assert cache.apply_query(key, data, query) == apply_query(data, query)
+
+    def test_prefix_filter_keeps_row_order(self):
+        """Prefix matches come back in row order, not sorted order."""
+        data = [{"m": "RC2"}, {"m": "CL1"}, {"m": "RC1"}, {"m": None}, {"m": "R"}]
+        cache = client.PaginationCache()
+        key = cache.create(data)
+
+        result, error = cache.apply_query(key, data, "[?starts_with(nvl(\"m\", ''), 'RC')]")
+
+        assert error is None
+        assert result == [data[0], data[2]]
+
+    @pytest.mark.parametrize(
+        "query",
+        ["[?starts_with(\"m\", 'R')]", "[?starts_with(nvl(\"m\", ''), '')]"],
+    )
+    def test_prefix_filter_defers_to_jmespath(self, query):
+        """Null fields and the empty prefix fall back to JMESPath semantics."""
+        data = [{"m": "RC1"}, {"m": None}]
+        cache = client.PaginationCache()
+        key = cache.create(data)
+
+        assert cache.apply_query(key, data, query) == apply_query(data, query)
+
+
+class TestContainsPrefilter:
+    """Tests for the raw-text prefilter applied to contains() row filters."""
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "[?contains(nvl(\"part/name\", ''), 'Resistor')]",
+            "[?contains(nvl(\"part/description\", ''), 'SMD') && \"part/type\" == 'local']",
+            "[?\"part/type\" == 'local' && contains(nvl(\"part/tags\", `[]`), 'smd')].\"part/name\"",
+            "[?contains(\"part/name\", 'part/name')]",
+        ],
+    )
+    def test_matches_jmespath(self, query):
+        """Prefiltered queries return the same result as a full scan."""
+        data = get_sample_parts()
+        cache = client.PaginationCache()
+        key = cache.create(data)
+
+        assert client._contains_prefilter(query)
+        assert cache.apply_query(key, data, query) == apply_query(data, query)
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "[?contains(\"t\", 'a')]",
+            "[?contains(\"n\", 'a')]",
+            "[?contains(\"n\", `1`) && contains(nvl(\"t\", ''), 'a')]",
+        ],
+    )
+    def test_type_errors_are_preserved(self, query):
+        """Queries that raise on some row still report the error."""
+        data = [{"t": "abc", "n": ["a"]}, {"t": None, "n": 5}]
+        cache = client.PaginationCache()
+        key = cache.create(data)
+
+        result, error = cache.apply_query(key, data, query)
+
+        assert error is not None
+        assert (result, error) == apply_query(data, query)
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "[?contains(lower(\"part/name\"), 'res')]",
+            "[?contains(nvl(\"part/name\", 'x'), 'x')]",
+            "[?contains(\"part/name\", 'say \"hi\"')]",
+            "[?contains(\"part/name\", '')]",
+            "[*].\"part/name\"",
+        ],
+    )
+    def test_unsupported_shapes_are_not_prefiltered(self, query):
+        """Computed subjects, nvl defaults and escaped literals use a full scan."""
+        assert client._contains_prefilter(query) == ()
+
+
+class TestQueryReturnsList:
+    """Tests for the query_returns_list AST classifier."""
+
+    @pytest.mark.parametrize(
+        "query",
+        ['[?"part/type" == \'local\']', '[*]."part/name"', 'sort_by(@, &"part/name")', "[1:3]"],
+    )
+    def test_list_shapes(self, query):
+        """Filters, projections, slices and sorts are known to yield lists."""
+        assert client.query_returns_list(query) is True
+
+    @pytest.mark.parametrize("query", ["length(@)", "[0]", "[?\"part/mpn\"] | [0]", "@", "[?"])
+    def test_other_shapes(self, query):
+        """Aggregations, indexing, pipes and invalid queries are not predicted."""
+        assert client.query_returns_list(query) is False
+
+
+class TestFilterPage:
+    """Tests for PaginationCache.filter_page early-stopping row filters."""
+
+    QUERY = '[?"part/type" == \'local\' && "part/mpn" != null]'
+
+    def test_requires_counted_filter(self):
+        """A filter that has not been evaluated in full is not paged early."""
+        data = get_sample_parts()
+        cache = client.PaginationCache()
+        key = cache.create(data)
+
+        assert cache.filter_page(key, data, self.QUERY, 0, 1) is None
+
+    @pytest.mark.parametrize("offset,limit", [(0, 1), (1, 1), (0, 100), (50, 10)])
+    def test_matches_full_evaluation(self, offset, limit):
+        """Early-stopped pages equal slices of the full result."""
+        data = get_sample_parts()
+        cache = client.PaginationCache()
+        key = cache.create(data)
+        expected, _ = cache.apply_query(key, data, self.QUERY)
+        cache.get(key).query_results.clear()
+
+        page, total = cache.filter_page(key, data, self.QUERY, offset, limit)
+
+        assert total == len(expected)
+        assert page == expected[offset : offset + limit]
+
+    @pytest.mark.parametrize(
+        "query", ['[?"part/mpn" != null]', '[?"part/name" == \'x\'].id', "sort_by(@, &\"part/name\")"]
+    )
+    def test_skips_indexed_and_non_row_filters(self, query):
+        """Without a memoized result, these queries are left to apply_query."""
+        data = get_sample_parts()
+        cache = client.PaginationCache()
+        key = cache.create(data)
+        cache.apply_query(key, data, query)
+        cache.get(key).query_results.clear()
+
+        assert cache.filter_page(key, data, query, 0, 1) is None
+
+    def test_slices_memoized_result(self):
+        """A memoized list result is paged without evaluating the query."""
+        data = get_sample_parts()
+        cache = client.PaginationCache()
+        key = cache.create(data)
+        expected, _ = cache.apply_query(key, data, "reverse(@)")
+
+        page, total = cache.filter_page(key, data, "reverse(@)", 1, 2)
+
+        assert total == len(data)
+        assert page == expected[1:3]
+
+
+class TestQueryResultMemo:
+    """Tests for the per-entry query result memo."""
+
+    def test_repeat_query_is_not_reevaluated(self, monkeypatch):
+        """A repeated query returns the memoized result object."""
+        data = get_sample_parts()
+        cache = client.PaginationCache()
+        key = cache.create(data)
+        first, _ = cache.apply_query(key, data, "[*].\"part/name\"")
+
+        def fail(*args):
+            raise AssertionError("query re-evaluated")
+
+        monkeypatch.setattr(client, "apply_query", fail)
+        second, error = cache.apply_query(key, data, " [*].\"part/name\" ")
+
+        assert error is None
+        assert second is first
+
+    def test_memo_is_bounded(self, monkeypatch):
+        """Only the most recently used results are kept."""
+        monkeypatch.setattr(client, "QUERY_RESULTS_PER_ENTRY", 2)
+        data = get_sample_parts()
+        cache = client.PaginationCache()
+        key = cache.create(data)
+
+        for query in ("[0]", "[1]", "[0]", "[2]"):
+            cache.apply_query(key, data, query)
+
+        assert list(cache.get(key).query_results) == ["[0]", "[2]"]
+
+    def test_errors_are_not_memoized(self):
+        """Failed queries are evaluated again on the next call."""
+        data = get_sample_parts()
+        cache = client.PaginationCache()
+        key = cache.create(data)
+
+        _, error = cache.apply_query(key, data, "[?")
+
+        assert error is not None
+        assert cache.get(key).query_results == {}
+
+
+class TestRequestCollapsing:
+    """Tests for collapsing concurrent identical read requests."""
+
+    def _slow_client(self, monkeypatch):
+        api = client.PartsBoxClient(api_key="test")
+        release = threading.Event()
+        calls = []
+
+        def send(operation, data=None):
+            calls.append(operation)
+            release.wait(timeout=5)
+            return {"data": len(calls)}
+
+        monkeypatch.setattr(api, "_send", send)
+        return api, release, calls
+
+    def test_concurrent_reads_share_one_request(self, monkeypatch):
+        """Identical reads in flight at the same time make one request."""
+        api, release, calls = self._slow_client(monkeypatch)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [
+                pool.submit(api._request, "part/stock", {"part/id": "p1"})
+                for _ in range(4)
+            ]
+            time.sleep(0.1)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert calls == ["part/stock"]
+        assert all(r is results[0] for r in results)
+        assert api._inflight == {}
+
+    def test_concurrent_catalog_fetches_share_one_request(self, monkeypatch):
+        """Concurrent get_all_parts() calls download the catalog once."""
+        api = client.PartsBoxClient(api_key="test")
+        release = threading.Event()
+        calls = []
+
+        def fetch(operation, parse=None):
+            calls.append(operation)
+            release.wait(timeout=5)
+            return [{"part/id": "p1"}]
+
+        monkeypatch.setattr(api, "_fetch_revalidated", fetch)
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(api.get_all_parts) for _ in range(3)]
+            time.sleep(0.1)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert calls == ["part/all"]
+        assert all(r is results[0] for r in results)
+
+    def test_writes_are_not_collapsed(self, monkeypatch):
+        """Write operations are always sent individually."""
+        api, release, calls = self._slow_client(monkeypatch)
+        release.set()
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            for f in [
+                pool.submit(api._request, "stock/add", {"stock/part-id": "p1"})
+                for _ in range(2)
+            ]:
+                f.result()
+
+        assert calls == ["stock/add", "stock/add"]
+
+    def test_read_after_write_is_not_joined_to_earlier_read(self, monkeypatch):
+        """A read starting after a write does not share a pre-write read."""
+        api = client.PartsBoxClient(api_key="test")
+        release = threading.Event()
+        calls = []
+
+        def send(operation, data=None):
+            calls.append(operation)
+            number = len(calls)
+            if number == 1:
+                release.wait(timeout=5)
+            return {"data": number}
+
+        monkeypatch.setattr(api, "_send", send)
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            before = pool.submit(api._request, "part/stock", {"part/id": "p1"})
+            time.sleep(0.1)
+            api._request("stock/add", {"stock/part-id": "p1"})
+            after = api._request("part/stock", {"part/id": "p1"})
+            release.set()
+            assert before.result() == {"data": 1}
+
+        assert calls == ["part/stock", "stock/add", "part/stock"]
+        assert after == {"data": 3}
+        assert api._inflight == {}
+
+    def test_error_is_shared_and_cleared(self, monkeypatch):
+        """A failed read raises for every waiter and is not remembered."""
+        api = client.PartsBoxClient(api_key="test")
+
+        def send(operation, data=None):
+            raise requests.ConnectionError("boom")
+
+        monkeypatch.setattr(api, "_send", send)
+
+        with pytest.raises(requests.ConnectionError):
+            api._request("lot/all")
+        assert api._inflight == {}
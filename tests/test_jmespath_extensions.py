@@ -3,7 +3,13 @@ Tests for custom JMESPath functions.
 """
 
 import pytest
-from partsbox_mcp.utils.jmespath_extensions import search_with_custom_functions
+from partsbox_mcp.utils.jmespath_extensions import (
+    FilterFallback,
+    compile_row_filter,
+    _compile_pattern,
+    compile_expression,
+    search_with_custom_functions,
+)
 
 
 class TestNvlFunction:
@@ -185,3 +191,96 @@ class TestRegexReplaceFunction:
         data = {"value": None}
         result = search_with_custom_functions("regex_replace('x', 'y', value)", data)
         assert result is None
+
+    def test_regex_replace_invalid_pattern_returns_value(self):
+        """regex_replace leaves the value unchanged for an invalid pattern."""
+        data = {"value": "100 ohm"}
+        result = search_with_custom_functions("regex_replace('(', '', value)", data)
+        assert result == "100 ohm"
+
+    def test_regex_replace_compiles_pattern_once(self):
+        """The pattern is compiled once for all rows of a query."""
+        data = [{"v": f"{n} ohm"} for n in range(5)]
+        query = "[*].regex_replace(' ohm$', '', v)"
+        search_with_custom_functions(query, data)
+        before = _compile_pattern.cache_info()
+
+        result = search_with_custom_functions(query, data)
+
+        after = _compile_pattern.cache_info()
+        assert result == ["0", "1", "2", "3", "4"]
+        assert after.misses == before.misses
+        assert after.hits == before.hits + 5
+
+
+class TestCompileExpression:
+    """Tests for the compiled-expression cache."""
+
+    def test_compile_reuses_parsed_expression(self):
+        """Repeated queries return the same compiled expression."""
+        first = compile_expression("items[?value > `1`]")
+        second = compile_expression("items[?value > `1`]")
+        assert first is second
+
+    def test_cached_expression_keeps_custom_functions(self):
+        """Queries served from the cache still resolve custom functions."""
+        data = {"value": None}
+        search_with_custom_functions("nvl(value, 'x')", data)
+        assert search_with_custom_functions("nvl(value, 'x')", data) == "x"
+
+
+class TestCompileRowFilter:
+    """Tests for closure-compiled row filters."""
+
+    ROWS = [
+        {"t": "local", "q": 5, "s": "R 10k", "tags": ["smd"], "f": True},
+        {"t": "linked", "q": 0, "s": "C 1uF", "tags": [], "f": False},
+        {"t": "local", "q": None, "s": None, "tags": None, "f": 0},
+        {"t": None, "q": 7, "s": "", "tags": ["tht", "smd"], "f": 1},
+        {"q": 12.5},
+        "not an object",
+    ]
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "[?t == 'local']",
+            "[?t != 'local']",
+            "[?q > `3`]",
+            "[?q <= `5` || t == 'linked']",
+            "[?t == 'local' && q]",
+            "[?!q]",
+            "[?!(t == 'local') && s]",
+            "[?f == `true`]",
+            "[?f == `1`]",
+            "[?contains(nvl(s, ''), 'R')]",
+            "[?contains(nvl(tags, `[]`), 'smd')]",
+            "[?nvl(t, 'none') == 'none']",
+            "[?@.t == 'local']",
+            "[?t == null]",
+            "[?q >= `5.0`]",
+            "[?q == `0`]",
+            "[?f > `0`]",
+            "[?tags > `0`]",
+        ],
+    )
+    def test_matches_interpreter(self, query):
+        """Compiled filters return the same rows as the interpreter."""
+        row_filter = compile_row_filter(query)
+
+        assert row_filter is not None
+        assert row_filter(self.ROWS) == search_with_custom_functions(query, self.ROWS)
+
+    def test_unsupported_expression_returns_none(self):
+        """Expressions outside the supported subset are not compiled."""
+        assert compile_row_filter("[?length(tags) > `0`]") is None
+        assert compile_row_filter("[*].t") is None
+        assert compile_row_filter("[?t == 'local'].s") is None
+
+    @pytest.mark.parametrize("query", ["[?contains(s, 'R')]", "[?s > `3`]"])
+    def test_type_error_falls_back(self, query):
+        """Rows the interpreter rejects raise so it can report the error."""
+        row_filter = compile_row_filter(query)
+
+        with pytest.raises(FilterFallback):
+            row_filter(self.ROWS)
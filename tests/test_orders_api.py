@@ -70,6 +70,67 @@ class TestListOrders:
         assert result2.success is True
         assert result2.cache_key == cache_key
 
+    def test_list_orders_returns_etag(self, fake_api_active):
+        """list_orders returns a content etag for the page."""
+        result = list_orders(limit=1)
+
+        assert result.etag is not None
+        assert result.unchanged is False
+
+    def test_cached_page_without_if_none_match_skips_etag(
+        self, fake_api_active, monkeypatch
+    ):
+        """Pages served from cache_key are not hashed unless an etag is given."""
+        result1 = list_orders(limit=1)
+        hashed = []
+        monkeypatch.setattr(
+            cache, "page_etag", lambda *args: hashed.append(args) or "etag"
+        )
+        result2 = list_orders(limit=1, offset=1, cache_key=result1.cache_key)
+
+        assert result2.success is True
+        assert result2.etag is None
+        assert result2.unchanged is False
+        assert len(result2.data) == 1
+        assert hashed == []
+
+    def test_list_orders_if_none_match_unchanged(self, fake_api_active):
+        """list_orders reports an unchanged page when the etag matches."""
+        result1 = list_orders(limit=1)
+        result2 = list_orders(
+            limit=1, cache_key=result1.cache_key, if_none_match=result1.etag
+        )
+
+        assert result2.success is True
+        assert result2.unchanged is True
+        assert result2.etag == result1.etag
+        assert result2.data == []
+
+    def test_list_orders_unchanged_keeps_pagination(self, fake_api_active):
+        """An unchanged page still reports the real total and has_more."""
+        result1 = list_orders(limit=1)
+        cached = list_orders(
+            limit=1, cache_key=result1.cache_key, if_none_match=result1.etag
+        )
+        fresh = list_orders(limit=1, if_none_match=result1.etag)
+
+        for result in (cached, fresh):
+            assert result.unchanged is True
+            assert result.total == 2
+            assert result.offset == 0
+            assert result.has_more is True
+
+    def test_list_orders_if_none_match_changed_page(self, fake_api_active):
+        """list_orders returns data when the etag belongs to another page."""
+        result1 = list_orders(limit=1)
+        result2 = list_orders(
+            limit=1, offset=1, cache_key=result1.cache_key, if_none_match=result1.etag
+        )
+
+        assert result2.unchanged is False
+        assert len(result2.data) == 1
+        assert result2.etag != result1.etag
+
     def test_list_orders_invalid_limit_low(self, fake_api_active):
         """list_orders rejects limit < 1."""
         result = list_orders(limit=0)
@@ -126,6 +187,18 @@ class TestListOrdersJMESPath:
         assert result.success is False
         assert "Invalid query expression" in result.error
 
+    def test_query_sort_reuses_sorted_view(self, fake_api_active):
+        """sort_by queries are memoized on the cache entry across pages."""
+        query = 'sort_by(@, &"order/created")'
+        first = list_orders(limit=1, query=query)
+        second = list_orders(limit=1, offset=1, cache_key=first.cache_key, query=query)
+
+        assert first.success is True
+        assert second.success is True
+        assert first.data[0]["order/created"] <= second.data[0]["order/created"]
+        entry = cache.get(first.cache_key)
+        assert list(entry.sorted_by) == ["order/created"]
+
 
 class TestGetOrder:
     """Tests for the get_order tool function."""
@@ -243,6 +316,28 @@ class TestGetOrderEntries:
         assert result2.success is True
         assert result2.cache_key == cache_key
 
+    def test_get_order_entries_if_none_match_fresh_fetch(self, fake_api_active):
+        """An etag also matches when the page is refetched without a cache key."""
+        result1 = get_order_entries("order_001")
+        result2 = get_order_entries("order_001", if_none_match=result1.etag)
+
+        assert result2.unchanged is True
+        assert result2.data == []
+
+    def test_get_order_entries_unchanged_keeps_pagination(self, fake_api_active):
+        """An unchanged cached page still reports the real total and has_more."""
+        result1 = get_order_entries("order_001", limit=1)
+        result2 = get_order_entries(
+            "order_001",
+            limit=1,
+            cache_key=result1.cache_key,
+            if_none_match=result1.etag,
+        )
+
+        assert result2.unchanged is True
+        assert result2.total == 2
+        assert result2.has_more is True
+
 
 class TestAddOrderEntries:
     """Tests for the add_order_entries tool function."""
@@ -4,13 +4,18 @@ Unit tests for the Parts API module.
 Tests cover:
 - list_parts: Basic listing, pagination, caching, JMESPath queries
 - get_part: Basic retrieval, not found handling
+- get_parts: Concurrent retrieval of several parts
+- Conditional (ETag) refetching of the parts catalog
 """
 
+import json
+
 import pytest
+import responses
 
-from partsbox_mcp.api.parts import list_parts, get_part
+from partsbox_mcp.api.parts import list_parts, get_part, get_parts, update_part
 from partsbox_mcp.client import cache, api_client
-from tests.fake_partsbox import SAMPLE_PARTS
+from tests.fake_partsbox import SAMPLE_PARTS, FakePartsBoxAPI, build_success_response
 
 
 class TestListParts:
@@ -116,8 +121,8 @@ class TestJMESPathFieldEscaping:
     - Double quotes ("part/name") create QUOTED IDENTIFIERS for field access
     - Backticks (`part/name`) create LITERAL JSON VALUES (strings)
 
-    Using backticks INCORRECTLY will cause queries to fail silently by
-    comparing against the literal string "part/name" instead of the field value.
+    Backtick-quoted field names would compare against the literal string
+    "part/name" instead of the field value, so such queries are rejected.
     """
 
     def test_double_quotes_access_field_correctly(self, fake_api_active):
@@ -140,35 +145,50 @@ class TestJMESPathFieldEscaping:
         assert result.success is True
         assert result.total == 2  # Two parts have 'resistor' tag
 
-    def test_backticks_create_literal_not_field_reference(self, fake_api_active):
+    def test_backticks_field_reference_rejected(self, fake_api_active):
         """
         CAUTION: Backticks create literal JSON values, NOT field references.
 
-        This test documents a common mistake. Using backticks like `part/tags`
-        creates the literal string "part/tags" instead of referencing the field.
-        This causes silent failures where queries return empty results.
+        `part/tags` would be the literal string "part/tags", so the filter
+        would silently match nothing. Such queries are rejected with a hint.
         """
-        # WRONG: Using backticks - this will NOT find any parts
-        # because it's checking if the literal string "part/tags" contains "resistor"
         result = list_parts(query='[?contains(`part/tags`, \'resistor\')]')
 
-        assert result.success is True
-        # Returns 0 because `part/tags` evaluates to the literal string "part/tags"
-        # and "part/tags" does not contain the substring "resistor"
-        assert result.total == 0  # This is the BUG behavior
+        assert result.success is False
+        assert "double quotes" in result.error
+        assert '"part/tags"' in result.error
 
-    def test_backticks_projection_creates_literals(self, fake_api_active):
-        """Backticks in projection create literal values, not field lookups."""
-        # WRONG: Using backticks in projection
+    def test_backticks_projection_rejected(self, fake_api_active):
+        """Backticks in projection are rejected rather than projecting constants."""
         result = list_parts(
             query='[*].{id: `part/id`, name: `part/name`}'
         )
 
+        assert result.success is False
+        assert "not backticks" in result.error
+
+    def test_backtick_json_literals_still_allowed(self, fake_api_active):
+        """Ordinary backtick literals (numbers, arrays, quoted strings) still work."""
+        result = list_parts(
+            query='[?contains(nvl("part/tags", `[]`), `"smd"`) && "part/created" > `0`]'
+        )
+
         assert result.success is True
-        # Each item will have literal strings instead of actual field values
-        first = result.data[0]
-        assert first["id"] == "part/id"  # Literal string, not the actual ID!
-        assert first["name"] == "part/name"  # Literal string, not the actual name!
+        assert result.total == 3
+
+    @pytest.mark.parametrize(
+        "query, expected_total",
+        [
+            ('[?"part/footprint" == `N/A`]', 0),
+            ('[?"part/footprint" != `I/O`]', 5),
+        ],
+    )
+    def test_backtick_values_with_slash_allowed(self, fake_api_active, query, expected_total):
+        """Literal values such as `N/A` are not mistaken for field names."""
+        result = list_parts(query=query)
+
+        assert result.success is True
+        assert result.total == expected_total
 
     def test_correct_projection_with_double_quotes(self, fake_api_active):
         """Double quotes in projection correctly access field values."""
@@ -290,6 +310,14 @@ class TestListPartsJMESPath:
         assert result.success is False
         assert "Invalid query expression" in result.error
 
+    def test_query_blank_is_ignored(self, fake_api_active):
+        """A whitespace-only query lists all parts unfiltered."""
+        result = list_parts(query="   ")
+
+        assert result.success is True
+        assert result.total == list_parts().total
+        assert result.query_applied is None
+
     def test_query_with_pagination(self, fake_api_active):
         """JMESPath query works with pagination."""
         # Get first page
@@ -329,6 +357,30 @@ class TestGetPart:
         assert result.data["part/name"] == "10K Resistor 0805"
         assert result.error is None
 
+    def test_get_part_from_cache_key(self, fake_api_active, monkeypatch):
+        """get_part serves a part from a list_parts cache entry without an API call."""
+        listed = list_parts()
+
+        def fail(*args):
+            raise AssertionError("API called")
+
+        monkeypatch.setattr(api_client, "get_part", fail)
+        result = get_part("part_002", cache_key=listed.cache_key)
+
+        assert result.success is True
+        assert result.data["part/id"] == "part_002"
+
+    def test_get_part_cache_miss_fetches(self, fake_api_active):
+        """get_part falls back to the API for unknown keys or parts."""
+        other_key = cache.create([SAMPLE_PARTS[0]])
+
+        by_part = get_part("part_002", cache_key=other_key)
+        by_key = get_part("part_001", cache_key="pb_unknown1")
+
+        assert by_part.success is True
+        assert by_part.data["part/id"] == "part_002"
+        assert by_key.success is True
+
     def test_get_part_not_found(self, fake_api_active):
         """get_part returns error for non-existent part."""
         result = get_part("nonexistent_part")
@@ -382,6 +434,56 @@ class TestGetPart:
         assert result2.data["part/img-id"] is None
 
 
+class TestGetParts:
+    """Tests for the get_parts tool function."""
+
+    def test_get_parts_preserves_order(self, fake_api_active):
+        """get_parts returns one response per id, in request order."""
+        result = get_parts(["part_003", "part_001", "missing_part"])
+
+        assert result.success is True
+        assert [r.success for r in result.data] == [True, True, False]
+        assert result.data[0].data["part/id"] == "part_003"
+        assert result.data[1].data["part/id"] == "part_001"
+        assert "not found" in result.data[2].error.lower()
+
+    def test_get_parts_uses_cache_entry(self, fake_api_active, monkeypatch):
+        """Parts in the cache entry are not fetched from the API."""
+        fetched = []
+        original = api_client.get_part
+        monkeypatch.setattr(
+            api_client, "get_part", lambda pid: fetched.append(pid) or original(pid)
+        )
+        key = cache.create([SAMPLE_PARTS[0]])
+
+        result = get_parts([SAMPLE_PARTS[0]["part/id"], "part_002"], cache_key=key)
+
+        assert all(r.success for r in result.data)
+        assert fetched == ["part_002"]
+
+    def test_get_parts_validation(self, fake_api_active):
+        """get_parts rejects empty and oversized id lists."""
+        assert get_parts([]).success is False
+        assert "at most 100" in get_parts([f"p{i}" for i in range(101)]).error
+
+    def test_get_parts_fetches_repeated_id_once(self, fake_api_active, monkeypatch):
+        """A repeated id is fetched once and answered at each of its positions."""
+        fetched = []
+        original = api_client.get_part
+        monkeypatch.setattr(
+            api_client, "get_part", lambda pid: fetched.append(pid) or original(pid)
+        )
+
+        result = get_parts(["part_001", "part_002", "part_001"])
+
+        assert sorted(fetched) == ["part_001", "part_002"]
+        assert [r.data["part/id"] for r in result.data] == [
+            "part_001",
+            "part_002",
+            "part_001",
+        ]
+
+
 class TestEmptyAPI:
     """Tests with empty API data."""
 
@@ -429,3 +531,82 @@ class TestCacheIntegration:
 
         assert info.valid is False
         assert info.total_items is None
+
+
+class TestConditionalFetch:
+    """Tests for ETag revalidation of the parts catalog."""
+
+    @pytest.fixture
+    def etag_api(self, fake_api_active, monkeypatch):
+        """Serve part/all with an ETag and answer matching requests with 304."""
+        monkeypatch.setattr(api_client, "_validated", {})
+        requests_seen = []
+
+        def handle(request):
+            requests_seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return (304, {}, "")
+            body = json.dumps(build_success_response(SAMPLE_PARTS))
+            return (200, {"ETag": '"v1"'}, body)
+
+        url = f"{FakePartsBoxAPI.BASE_URL}/part/all"
+        fake_api_active._mock.remove(responses.POST, url)
+        fake_api_active._mock.add_callback(
+            responses.POST, url, callback=handle, content_type="application/json"
+        )
+        return requests_seen
+
+    def test_unchanged_catalog_reuses_cache_entry(self, etag_api):
+        """A 304 reuses the parsed parts and the existing cache entry."""
+        first = list_parts()
+        second = list_parts()
+
+        assert etag_api == [None, '"v1"']
+        assert second.success is True
+        assert second.cache_key == first.cache_key
+        assert second.data == first.data
+
+    def test_invalidated_entry_gets_new_key(self, etag_api):
+        """An unchanged catalog still gets a new key once its entry is gone."""
+        first = list_parts()
+        cache.invalidate(first.cache_key)
+        second = list_parts()
+
+        assert second.success is True
+        assert second.cache_key != first.cache_key
+        assert second.total == len(SAMPLE_PARTS)
+
+    def test_part_write_forces_full_fetch(self, etag_api):
+        """After a part write the catalog is fetched unconditionally."""
+        first = list_parts()
+        update_part("part_001", notes="changed")
+        second = list_parts()
+
+        assert etag_api == [None, None]
+        assert second.cache_key != first.cache_key
+
+    def test_rejected_conditional_request_is_retried(self, fake_api_active, monkeypatch):
+        """A 412 to If-None-Match drops the validator and refetches unconditionally."""
+        monkeypatch.setattr(api_client, "_validated", {})
+        requests_seen = []
+
+        def handle(request):
+            requests_seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match"):
+                return (412, {}, "")
+            body = json.dumps(build_success_response(SAMPLE_PARTS))
+            return (200, {"ETag": '"v1"'}, body)
+
+        url = f"{FakePartsBoxAPI.BASE_URL}/part/all"
+        fake_api_active._mock.remove(responses.POST, url)
+        fake_api_active._mock.add_callback(
+            responses.POST, url, callback=handle, content_type="application/json"
+        )
+
+        list_parts()
+        second = list_parts()
+
+        assert second.success is True
+        assert second.total == len(SAMPLE_PARTS)
+        assert requests_seen == [None, '"v1"', None]
+
@@ -7,12 +7,15 @@ Tests cover:
 - delete_part: Deleting parts
 - add_meta_part_ids/remove_meta_part_ids: Meta-part membership
 - add_substitute_ids/remove_substitute_ids: Part substitutes
+- Sending id-list updates through the id batcher
 - get_part_storage: Aggregated stock by location
 - get_part_lots: Individual lot entries
 - get_part_stock: Total stock count
+- get_parts_stock: Concurrent stock counts for several parts
 """
 
 import pytest
+import requests
 
 from partsbox_mcp.api.parts import (
     create_part,
@@ -25,7 +28,9 @@ from partsbox_mcp.api.parts import (
     get_part_storage,
     get_part_lots,
     get_part_stock,
+    get_parts_stock,
 )
+from partsbox_mcp.client import api_client, cache
 
 
 class TestCreatePart:
@@ -91,6 +96,19 @@ class TestCreatePart:
         assert result.success is True
         assert result.data is not None
 
+    def test_create_part_api_error(self, monkeypatch):
+        """create_part reports request failures as an error response."""
+
+        def failing_request(operation, data=None):
+            raise requests.ConnectionError("unreachable")
+
+        monkeypatch.setattr(api_client, "_request", failing_request)
+
+        result = create_part(name="Offline Part")
+
+        assert result.success is False
+        assert result.error == "API request failed: unreachable"
+
 
 class TestUpdatePart:
     """Tests for the update_part function."""
@@ -225,6 +243,31 @@ class TestSubstituteIds:
         assert result.error is None
 
 
+class TestIdBatching:
+    """Tests for sending id-list updates through the id batcher."""
+
+    def test_request_failure_is_reported(self, monkeypatch):
+        """A failed batched request comes back as a failure response."""
+        payloads = []
+
+        def failing_request(operation, data=None):
+            payloads.append((operation, data))
+            raise requests.ConnectionError("boom")
+
+        monkeypatch.setattr(api_client, "_request", failing_request)
+
+        result = remove_meta_part_ids("meta_001", ["part_001"])
+
+        assert result.success is False
+        assert "boom" in result.error
+        assert payloads == [
+            (
+                "part/remove-meta-part-ids",
+                {"part/id": "meta_001", "part/meta-part-ids": ["part_001"]},
+            )
+        ]
+
+
 class TestGetPartStorage:
     """Tests for get_part_storage function."""
 
@@ -266,6 +309,21 @@ class TestGetPartStorage:
         assert result.success is False
         assert "offset must be non-negative" in result.error
 
+    def test_get_part_storage_query_memoized(self, fake_api_active):
+        """Paging through a query evaluates it once per cache entry."""
+        query = '[?"source/quantity" > `0`]'
+        first = get_part_storage(part_id="part_001", limit=1, query=query)
+        entry = cache.get(first.cache_key)
+
+        assert first.success is True
+        assert query in entry.query_results
+
+        second = get_part_storage(
+            part_id="part_001", limit=1, offset=1, cache_key=first.cache_key, query=query
+        )
+        assert second.success is True
+        assert second.total == first.total
+
 
 class TestGetPartLots:
     """Tests for get_part_lots function."""
@@ -304,9 +362,57 @@ class TestGetPartStock:
         assert result.total == 500  # From sample data: 500 - 100 + 100 = 500
         assert result.error is None
 
+    def test_get_part_stock_from_cached_sources(self, fake_api_active, monkeypatch):
+        """get_part_stock sums a cached source listing without an API call."""
+        storage = get_part_storage(part_id="part_001")
+        expected = get_part_stock(part_id="part_001").total
+
+        def fail(*args, **kwargs):
+            raise AssertionError("unexpected API request")
+
+        monkeypatch.setattr(api_client, "_request", fail)
+        result = get_part_stock(part_id="part_001", cache_key=storage.cache_key)
+
+        assert result.success is True
+        assert result.total == expected
+
+    def test_get_part_stock_ignores_other_parts_cache(self, fake_api_active):
+        """A cache entry for another part falls back to the API."""
+        storage = get_part_storage(part_id="part_002")
+        result = get_part_stock(part_id="part_001", cache_key=storage.cache_key)
+
+        assert result.success is True
+        assert result.total == 500
+
     def test_get_part_stock_empty_id(self, fake_api_active):
         """get_part_stock fails with empty part_id."""
         result = get_part_stock(part_id="")
 
         assert result.success is False
         assert "part_id is required" in result.error
+
+
+class TestGetPartsStock:
+    """Tests for get_parts_stock function."""
+
+    def test_get_parts_stock_keyed_by_id(self, fake_api_active):
+        """get_parts_stock returns one result per distinct part id."""
+        result = get_parts_stock(["part_001", "part_002", "part_001"])
+
+        assert result.success is True
+        assert list(result.data) == ["part_001", "part_002"]
+        assert result.data["part_001"].total == 500
+
+    def test_get_parts_stock_empty_ids(self, fake_api_active):
+        """get_parts_stock fails with no part ids."""
+        result = get_parts_stock([])
+
+        assert result.success is False
+        assert "part_ids is required" in result.error
+
+    def test_get_parts_stock_too_many_ids(self, fake_api_active):
+        """get_parts_stock rejects oversized batches."""
+        result = get_parts_stock([f"part_{n}" for n in range(101)])
+
+        assert result.success is False
+        assert "at most 100" in result.error
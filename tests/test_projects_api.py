@@ -16,7 +16,11 @@ Tests cover:
 - get_build / update_build: Build operations
 """
 
+import json
+
 import pytest
+import requests
+import responses
 
 from partsbox_mcp.api.projects import (
     add_project_entries,
@@ -34,7 +38,8 @@ from partsbox_mcp.api.projects import (
     update_project,
     update_project_entries,
 )
-from partsbox_mcp.client import cache
+from partsbox_mcp.client import api_client, cache
+from tests.fake_partsbox import SAMPLE_PROJECTS, FakePartsBoxAPI, build_success_response
 
 
 class TestListProjects:
@@ -55,6 +60,14 @@ class TestListProjects:
         assert result.success is True
         assert result.total == 3  # All 3 projects
 
+    def test_list_projects_blank_query_is_ignored(self, fake_api_active):
+        """A whitespace-only query is treated as no query."""
+        result = list_projects(query="   ")
+
+        assert result.success is True
+        assert result.total == 2
+        assert result.query_applied is None
+
     def test_list_projects_returns_cache_key(self, fake_api_active):
         """list_projects returns a valid cache key."""
         result = list_projects()
@@ -81,6 +94,17 @@ class TestListProjects:
         assert result2.success is True
         assert result2.cache_key == cache_key
 
+    def test_list_projects_reuses_active_view(self, fake_api_active):
+        """The non-archived subset is built once per cache entry."""
+        result1 = list_projects(limit=1)
+        entry = cache.get(result1.cache_key)
+        view = entry.views["active"]
+
+        result2 = list_projects(limit=1, offset=1, cache_key=result1.cache_key)
+
+        assert result2.total == result1.total == len(view)
+        assert entry.views["active"] is view
+
 
 class TestListProjectsJMESPath:
     """Tests for JMESPath query support in list_projects."""
@@ -92,6 +116,15 @@ class TestListProjectsJMESPath:
         assert result.success is True
         assert result.total == 1  # Only Arduino Shield
 
+    def test_query_over_active_view_memoized(self, fake_api_active):
+        """Queries over the non-archived projects are memoized per entry."""
+        query = 'sort_by(@, &"project/name")'
+        result = list_projects(query=query)
+        entry = cache.get(result.cache_key)
+
+        assert ("active", query) in entry.query_results
+        assert entry.query_results[("active", query)] == result.data
+
     def test_query_projection(self, fake_api_active):
         """JMESPath projection works."""
         result = list_projects(query='[*].{name: "project/name", entries: "project/entry-count"}')
@@ -102,6 +135,75 @@ class TestListProjectsJMESPath:
         assert "entries" in first
 
 
+class TestConditionalProjectFetch:
+    """Tests for ETag revalidation of the project list."""
+
+    @pytest.fixture
+    def etag_api(self, fake_api_active, monkeypatch):
+        """Serve project/all with an ETag and answer matching requests with 304."""
+        monkeypatch.setattr(api_client, "_validated", {})
+        requests_seen = []
+
+        def handle(request):
+            requests_seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return (304, {}, "")
+            body = json.dumps(build_success_response(SAMPLE_PROJECTS))
+            return (200, {"ETag": '"v1"'}, body)
+
+        url = f"{FakePartsBoxAPI.BASE_URL}/project/all"
+        fake_api_active._mock.remove(responses.POST, url)
+        fake_api_active._mock.add_callback(
+            responses.POST, url, callback=handle, content_type="application/json"
+        )
+        return requests_seen
+
+    def test_unchanged_list_reuses_cache_entry(self, etag_api):
+        """A 304 reuses the parsed projects, cache entry and active view."""
+        first = list_projects()
+        second = list_projects()
+
+        assert etag_api == [None, '"v1"']
+        assert second.success is True
+        assert second.cache_key == first.cache_key
+        assert second.data == first.data
+        assert list(cache.get(first.cache_key).views) == ["active"]
+
+    def test_project_write_forces_full_fetch(self, etag_api):
+        """After a project write the list is fetched unconditionally."""
+        first = list_projects()
+        update_project("proj_001", name="Renamed")
+        second = list_projects()
+
+        assert etag_api == [None, None]
+        assert second.cache_key != first.cache_key
+
+    def test_rejected_conditional_request_is_retried(self, fake_api_active, monkeypatch):
+        """A 412 to If-None-Match drops the validator and refetches unconditionally."""
+        monkeypatch.setattr(api_client, "_validated", {})
+        requests_seen = []
+
+        def handle(request):
+            requests_seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match"):
+                return (412, {}, "")
+            body = json.dumps(build_success_response(SAMPLE_PROJECTS))
+            return (200, {"ETag": '"v1"'}, body)
+
+        url = f"{FakePartsBoxAPI.BASE_URL}/project/all"
+        fake_api_active._mock.remove(responses.POST, url)
+        fake_api_active._mock.add_callback(
+            responses.POST, url, callback=handle, content_type="application/json"
+        )
+
+        list_projects()
+        second = list_projects()
+
+        assert second.success is True
+        assert second.total > 0
+        assert requests_seen == [None, '"v1"', None]
+
+
 class TestGetProject:
     """Tests for the get_project tool function."""
 
@@ -330,6 +432,31 @@ class TestDeleteProjectEntries:
         assert "entry_ids is required" in result.error
 
 
+class TestEntryBatching:
+    """Tests for sending BOM entry mutations through the entry batcher."""
+
+    def test_request_failure_is_reported(self, monkeypatch):
+        """A failed batched request comes back as a failure response."""
+        payloads = []
+
+        def failing_request(operation, data=None):
+            payloads.append((operation, data))
+            raise requests.ConnectionError("boom")
+
+        monkeypatch.setattr(api_client, "_request", failing_request)
+
+        result = delete_project_entries("proj_001", ["entry_001"])
+
+        assert result.success is False
+        assert "boom" in result.error
+        assert payloads == [
+            (
+                "project/delete-entries",
+                {"project/id": "proj_001", "entry/ids": ["entry_001"]},
+            )
+        ]
+
+
 class TestGetProjectBuilds:
     """Tests for the get_project_builds tool function."""
 